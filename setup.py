@@ -15,7 +15,8 @@ setup(
         "psycopg2-binary",
         "neo4j",
         "python-dotenv",
-        "asyncpg==0.30.0"
+        "asyncpg==0.30.0",
+        "orjson"
     ],
     python_requires=">=3.8",
     author="Your Name",
@@ -5,6 +5,7 @@ This module provides a structured approach to generate test data for the AML mon
 It uses generators for efficient memory usage and provides progress tracking.
 """
 
+import asyncio
 import json
 import logging
 import random
@@ -47,8 +48,9 @@ class ProgressTracker:
     def update(self, n: int = 1):
         """Update progress."""
         self.current += n
-        if self.current % 100 == 0:  # Only log every 100 items
-            logger.warning(f"{self.description}: {self.current}/{self.total}")
+        # Only log every 100 items and on completion
+        if self.current % 100 == 0 or self.current == self.total:
+            logger.warning("%s: %d/%d", self.description, self.current, self.total)
 
 class DataGenerator:
     """Main class for orchestrating data generation."""
@@ -105,14 +107,13 @@ class DataGenerator:
             if df_data:
                 await self.postgres_handler.save_batch(df_data)
                 
-                # Save to Neo4j - convert to dicts first
-                for table_name, items in batch_data.items():
-                    if items:
-                        records = [item.model_dump() for item in items]
-                        await self.neo4j_handler.save_batch(table_name, records)
+                # Save to Neo4j from the same DataFrames, prepared column-wise,
+                # writing independent tables concurrently
+                await self.neo4j_handler.save_to_neo4j(df_data)
                 
                 # Log a simple summary
-                logger.warning(f"Saved: {', '.join(f'{k}={len(v)}' for k, v in batch_data.items())}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Saved: %s", ', '.join(f'{k}={len(v)}' for k, v in batch_data.items()))
         except (DatabaseError, BatchError) as e:
             raise DatabaseError(f"Failed to save batch: {str(e)}")
         except Exception as e:
@@ -227,18 +228,22 @@ class DataGenerator:
     async def generate_all_related_data(self, institution_subsidiary_batch):
         """Generate and persist all entity-related data."""
         logger.warning("Generating related data...")
+        progress = ProgressTracker(
+            len(institution_subsidiary_batch['institutions']) + len(institution_subsidiary_batch['subsidiaries']),
+            "Generated related data"
+        )
 
         # Process each institution
         for institution in institution_subsidiary_batch['institutions']:
             # Generate address for institution
-            logger.warning(f"Generating address for institution {institution.institution_id}")
+            logger.debug("Generating address for institution %s", institution.institution_id)
             address = await self.address_gen.generate(institution.institution_id, 'institution').__anext__()
             await self.persist_batch({'addresses': [address]})
-            logger.warning("Saved institution address")
+            logger.debug("Saved institution address")
 
             # Generate beneficial owners for institution
             num_owners = random.randint(1, self.config.get('max_beneficial_owners_per_institution', 3))
-            logger.warning(f"Generating {num_owners} beneficial owners for institution {institution.institution_id}")
+            logger.debug("Generating %s beneficial owners for institution %s", num_owners, institution.institution_id)
             beneficial_owners = []
             for _ in range(num_owners):
                 owner = await self.beneficial_owner_gen.generate(institution.institution_id, 'institution').__anext__()
@@ -247,11 +252,11 @@ class DataGenerator:
             # Save beneficial owners
             if beneficial_owners:
                 await self.persist_batch({'beneficial_owners': beneficial_owners})
-                logger.warning(f"Saved {len(beneficial_owners)} beneficial owners")
+                logger.debug("Saved %s beneficial owners", len(beneficial_owners))
             
             # Generate accounts for institution
             num_accounts = random.randint(1, self.config.get('max_accounts_per_institution', 3))
-            logger.warning(f"Generating {num_accounts} accounts for institution {institution.institution_id}")
+            logger.debug("Generating %s accounts for institution %s", num_accounts, institution.institution_id)
             accounts = []
             for _ in range(num_accounts):
                 account = await self.account_gen.generate(institution.institution_id, 'institution').__anext__()
@@ -260,30 +265,45 @@ class DataGenerator:
             # Save accounts first
             if accounts:
                 await self.persist_batch({'accounts': accounts})
-                logger.warning(f"Saved {len(accounts)} accounts")
+                logger.debug("Saved %s accounts", len(accounts))
                 
-            # Now generate and save transactions for each account
-            for account in accounts:
-                # Generate transactions for this account
-                num_transactions = random.randint(
-                    self.config.get('min_transactions_per_account', 5),
-                    self.config.get('max_transactions_per_account', 10)
-                )
-                
-                logger.warning(f"Generating {num_transactions} transactions for account {account.account_id}")
-                transactions = []
-                for _ in range(num_transactions):
-                    transaction = await self.transaction_gen.generate(account).__anext__()
-                    transactions.append(transaction)
-                
-                # Save transactions for this account
-                if transactions:
-                    await self.persist_batch({'transactions': transactions})
-                    logger.warning(f"Saved {len(transactions)} transactions")
+            # Now generate and save transactions for each account. Each
+            # account's save runs while the next account's transactions are
+            # generated, with at most one save in flight. The generators never
+            # suspend, so the loop yields after each transaction to let the
+            # pending save make progress.
+            pending = None
+            try:
+                for account in accounts:
+                    # Generate transactions for this account
+                    num_transactions = random.randint(
+                        self.config.get('min_transactions_per_account', 5),
+                        self.config.get('max_transactions_per_account', 10)
+                    )
+                    
+                    logger.debug("Generating %s transactions for account %s", num_transactions, account.account_id)
+                    transactions = []
+                    for _ in range(num_transactions):
+                        transaction = await self.transaction_gen.generate(account).__anext__()
+                        transactions.append(transaction)
+                        if pending:
+                            await asyncio.sleep(0)
+                    
+                    # Save transactions for this account
+                    if transactions:
+                        if pending:
+                            await pending
+                        pending = asyncio.create_task(self.persist_batch({'transactions': transactions}))
+                        logger.debug("Saving %s transactions", len(transactions))
+                if pending:
+                    await pending
+            finally:
+                if pending and not pending.done():
+                    pending.cancel()
             
             # Generate risk assessments for institution
             num_risk_assessments = random.randint(1, self.config.get('max_risk_assessments_per_institution', 2))
-            logger.warning(f"Generating {num_risk_assessments} risk assessments for institution {institution.institution_id}")
+            logger.debug("Generating %s risk assessments for institution %s", num_risk_assessments, institution.institution_id)
             risk_assessments = []
             for _ in range(num_risk_assessments):
                 assessment = await self.risk_assessment_gen.generate(institution.institution_id, 'institution').__anext__()
@@ -292,11 +312,11 @@ class DataGenerator:
             # Save risk assessments
             if risk_assessments:
                 await self.persist_batch({'risk_assessments': risk_assessments})
-                logger.warning(f"Saved {len(risk_assessments)} risk assessments")
+                logger.debug("Saved %s risk assessments", len(risk_assessments))
 
             # Generate authorized persons
             num_auth_persons = random.randint(1, self.config.get('max_authorized_persons_per_institution', 3))
-            logger.warning(f"Generating {num_auth_persons} authorized persons for institution {institution.institution_id}")
+            logger.debug("Generating %s authorized persons for institution %s", num_auth_persons, institution.institution_id)
             auth_persons = []
             for _ in range(num_auth_persons):
                 auth_person = await self.authorized_person_gen.generate(institution.institution_id, 'institution').__anext__()
@@ -304,11 +324,11 @@ class DataGenerator:
             
             if auth_persons:
                 await self.persist_batch({'authorized_persons': auth_persons})
-                logger.warning(f"Saved {len(auth_persons)} authorized persons")
+                logger.debug("Saved %s authorized persons", len(auth_persons))
 
             # Generate compliance events
             num_events = random.randint(1, self.config.get('max_compliance_events_per_institution', 3))
-            logger.warning(f"Generating {num_events} compliance events for institution {institution.institution_id}")
+            logger.debug("Generating %s compliance events for institution %s", num_events, institution.institution_id)
             events = []
             for _ in range(num_events):
                 event = await self.compliance_event_gen.generate(institution.institution_id, 'institution').__anext__()
@@ -316,11 +336,11 @@ class DataGenerator:
             
             if events:
                 await self.persist_batch({'compliance_events': events})
-                logger.warning(f"Saved {len(events)} compliance events")
+                logger.debug("Saved %s compliance events", len(events))
 
             # Generate documents
             num_documents = random.randint(1, self.config.get('max_documents_per_institution', 5))
-            logger.warning(f"Generating {num_documents} documents for institution {institution.institution_id}")
+            logger.debug("Generating %s documents for institution %s", num_documents, institution.institution_id)
             documents = []
             for _ in range(num_documents):
                 document = await self.document_gen.generate(institution.institution_id, 'institution').__anext__()
@@ -328,11 +348,11 @@ class DataGenerator:
             
             if documents:
                 await self.persist_batch({'documents': documents})
-                logger.warning(f"Saved {len(documents)} documents")
+                logger.debug("Saved %s documents", len(documents))
 
             # Generate jurisdiction presences
             num_jurisdictions = random.randint(1, self.config.get('max_jurisdictions_per_institution', 3))
-            logger.warning(f"Generating {num_jurisdictions} jurisdiction presences for institution {institution.institution_id}")
+            logger.debug("Generating %s jurisdiction presences for institution %s", num_jurisdictions, institution.institution_id)
             jurisdictions = []
             for _ in range(num_jurisdictions):
                 jurisdiction = await self.jurisdiction_presence_gen.generate(institution.institution_id, 'institution').__anext__()
@@ -340,19 +360,20 @@ class DataGenerator:
             
             if jurisdictions:
                 await self.persist_batch({'jurisdiction_presences': jurisdictions})
-                logger.warning(f"Saved {len(jurisdictions)} jurisdiction presences")
+                logger.debug("Saved %s jurisdiction presences", len(jurisdictions))
+            progress.update()
 
         # Process each subsidiary
         for subsidiary in institution_subsidiary_batch['subsidiaries']:
             # Generate address for subsidiary
-            logger.warning(f"Generating address for subsidiary {subsidiary.subsidiary_id}")
+            logger.debug("Generating address for subsidiary %s", subsidiary.subsidiary_id)
             address = await self.address_gen.generate(subsidiary.subsidiary_id, 'subsidiary').__anext__()
             await self.persist_batch({'addresses': [address]})
-            logger.warning("Saved subsidiary address")
+            logger.debug("Saved subsidiary address")
 
             # Generate authorized persons for subsidiary
             num_auth_persons = random.randint(1, self.config.get('max_authorized_persons_per_subsidiary', 2))
-            logger.warning(f"Generating {num_auth_persons} authorized persons for subsidiary {subsidiary.subsidiary_id}")
+            logger.debug("Generating %s authorized persons for subsidiary %s", num_auth_persons, subsidiary.subsidiary_id)
             auth_persons = []
             for _ in range(num_auth_persons):
                 auth_person = await self.authorized_person_gen.generate(subsidiary.subsidiary_id, 'subsidiary').__anext__()
@@ -360,11 +381,11 @@ class DataGenerator:
             
             if auth_persons:
                 await self.persist_batch({'authorized_persons': auth_persons})
-                logger.warning(f"Saved {len(auth_persons)} authorized persons")
+                logger.debug("Saved %s authorized persons", len(auth_persons))
 
             # Generate compliance events for subsidiary
             num_events = random.randint(1, self.config.get('max_compliance_events_per_subsidiary', 2))
-            logger.warning(f"Generating {num_events} compliance events for subsidiary {subsidiary.subsidiary_id}")
+            logger.debug("Generating %s compliance events for subsidiary %s", num_events, subsidiary.subsidiary_id)
             events = []
             for _ in range(num_events):
                 event = await self.compliance_event_gen.generate(subsidiary.subsidiary_id, 'subsidiary').__anext__()
@@ -372,11 +393,11 @@ class DataGenerator:
             
             if events:
                 await self.persist_batch({'compliance_events': events})
-                logger.warning(f"Saved {len(events)} compliance events")
+                logger.debug("Saved %s compliance events", len(events))
 
             # Generate documents for subsidiary
             num_documents = random.randint(1, self.config.get('max_documents_per_subsidiary', 3))
-            logger.warning(f"Generating {num_documents} documents for subsidiary {subsidiary.subsidiary_id}")
+            logger.debug("Generating %s documents for subsidiary %s", num_documents, subsidiary.subsidiary_id)
             documents = []
             for _ in range(num_documents):
                 document = await self.document_gen.generate(subsidiary.subsidiary_id, 'subsidiary').__anext__()
@@ -384,11 +405,11 @@ class DataGenerator:
             
             if documents:
                 await self.persist_batch({'documents': documents})
-                logger.warning(f"Saved {len(documents)} documents")
+                logger.debug("Saved %s documents", len(documents))
 
             # Generate jurisdiction presences for subsidiary
             num_jurisdictions = random.randint(1, self.config.get('max_jurisdictions_per_subsidiary', 2))
-            logger.warning(f"Generating {num_jurisdictions} jurisdiction presences for subsidiary {subsidiary.subsidiary_id}")
+            logger.debug("Generating %s jurisdiction presences for subsidiary %s", num_jurisdictions, subsidiary.subsidiary_id)
             jurisdictions = []
             for _ in range(num_jurisdictions):
                 jurisdiction = await self.jurisdiction_presence_gen.generate(subsidiary.subsidiary_id, 'subsidiary').__anext__()
@@ -396,8 +417,9 @@ class DataGenerator:
             
             if jurisdictions:
                 await self.persist_batch({'jurisdiction_presences': jurisdictions})
-                logger.warning(f"Saved {len(jurisdictions)} jurisdiction presences")
-            
+                logger.debug("Saved %s jurisdiction presences", len(jurisdictions))
+            progress.update()
+
         logger.warning("Completed generating related data")
 
 async def generate_test_data(config: Dict[str, Any], postgres_handler: PostgresHandler, neo4j_handler: Neo4jHandler):
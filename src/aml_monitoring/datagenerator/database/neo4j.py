@@ -1,10 +1,16 @@
 """Neo4j database handler."""
 
 import os
+import re
+import asyncio
+from itertools import islice
+from contextlib import asynccontextmanager
 from typing import Dict, List, Any, Optional, Set
+import numpy as np
 import pandas as pd
-from neo4j import AsyncGraphDatabase, AsyncDriver
-import json
+from neo4j import AsyncGraphDatabase, AsyncDriver, unit_of_work
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+import orjson
 from datetime import datetime, date
 from uuid import UUID
 from enum import Enum
@@ -12,6 +18,22 @@ from enum import Enum
 from .base import DatabaseHandler
 from .exceptions import ConnectionError, ValidationError, SchemaError, BatchError, DatabaseError, DatabaseInitializationError
 
+
+def _dumps_json(value: Any) -> str:
+    """Serialize a dict/list property to a JSON string with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _format_dates(series: pd.Series) -> pd.Series:
+    """Format a datetime column as 'YYYY-MM-DD' strings, keeping nulls."""
+    if not pd.api.types.is_datetime64_dtype(series):
+        # Timezone-aware columns go through pandas' per-element strftime
+        return series.dt.strftime('%Y-%m-%d')
+    # NumPy formats the whole array in C, several times faster than strftime
+    formatted = np.datetime_as_string(series.to_numpy(), unit='D')
+    return pd.Series(formatted, index=series.index).where(series.notna())
+
+
 class Neo4jHandler(DatabaseHandler):
     """Handler for Neo4j database operations."""
     
@@ -220,7 +242,7 @@ class Neo4jHandler(DatabaseHandler):
             'properties': []
         },
         'LOCATED_IN': {
-            'from_label': ['Institution', 'Subsidiary'],
+            'from_label': ['Institution', 'Subsidiary', 'Address'],
             'to_label': 'Country',
             'properties': ['location_type', 'start_date']
         },
@@ -289,6 +311,336 @@ class Neo4jHandler(DatabaseHandler):
         }
     }
 
+    # Shared dimension nodes each label's relationship statements MATCH,
+    # and the prepared record fields holding their keys
+    DIMENSION_FIELDS = {
+        'Transaction': {'BusinessDate': ['transaction_date']},
+        'Account': {'BusinessDate': ['opening_date']},
+        'Subsidiary': {'BusinessDate': ['incorporation_date'], 'Country': ['incorporation_country']},
+        'Institution': {'BusinessDate': ['incorporation_date'], 'Country': ['incorporation_country']},
+        'Document': {'BusinessDate': ['issue_date']},
+        'BeneficialOwner': {'Country': ['nationality']},
+        'Address': {'Country': ['country']},
+        'AuthorizedPerson': {'Country': ['nationality']}
+    }
+
+    # Property naming the node whose relationships a label's rows lock, used
+    # to shard save_batch chunks; other labels shard on their primary key
+    SHARD_KEYS = {
+        'Transaction': 'account_id',
+        'Account': 'entity_id',
+        'RiskAssessment': 'entity_id',
+        'Document': 'entity_id',
+        'BeneficialOwner': 'entity_id',
+        'AuthorizedPerson': 'entity_id',
+        'ComplianceEvent': 'entity_id',
+        'Address': 'entity_id'
+    }
+
+    # Relationship statements run after the node upsert for each label. Every
+    # statement receives a whole chunk of prepared records as $rows, so a chunk
+    # costs one round trip per statement rather than one per record.
+    RELATIONSHIP_QUERIES = {
+        'Transaction': [
+            """
+            UNWIND $rows AS row
+            // Match the transaction upserted earlier in this transaction
+            MATCH (t:Transaction {transaction_id: row.transaction_id})
+
+            // Create accounts if they don't exist with required fields
+            MERGE (debit:Account {account_id: row.debit_account_id})
+            ON CREATE SET debit += {
+                entity_id: row.debit_account_id,
+                entity_type: 'Institution',
+                account_type: 'Unknown',
+                account_number: row.debit_account_id,
+                currency: row.currency,
+                status: 'Active',
+                opening_date: row.transaction_date,
+                balance: 0,
+                risk_rating: 'Medium'
+            }
+
+            MERGE (credit:Account {account_id: row.credit_account_id})
+            ON CREATE SET credit += {
+                entity_id: row.credit_account_id,
+                entity_type: 'Institution',
+                account_type: 'Unknown',
+                account_number: row.credit_account_id,
+                currency: row.currency,
+                status: 'Active',
+                opening_date: row.transaction_date,
+                balance: 0,
+                risk_rating: 'Medium'
+            }
+
+            // Create SENT and RECEIVED relationships
+            MERGE (debit)-[:SENT {
+                amount: row.amount,
+                currency: row.currency
+            }]->(t)
+            MERGE (t)-[:RECEIVED {
+                amount: row.amount,
+                currency: row.currency
+            }]->(credit)
+
+            // Create TRANSACTED relationships
+            MERGE (debit)-[:TRANSACTED {
+                transaction_date: row.transaction_date
+            }]->(t)
+            MERGE (credit)-[:TRANSACTED {
+                transaction_date: row.transaction_date
+            }]->(t)
+
+            // A read after writes needs one WITH to separate them
+            WITH row, t
+
+            // Create TRANSACTED_ON relationship with BusinessDate
+            MATCH (d:BusinessDate {date: row.transaction_date})
+            MERGE (t)-[:TRANSACTED_ON]->(d)
+            """
+        ],
+        'Account': [
+            # Create HAS_ACCOUNT relationship with Institution
+            """
+            UNWIND $rows AS row
+            MATCH (i:Institution {institution_id: row.entity_id})
+            MATCH (a:Account {account_id: row.account_id})
+            MERGE (i)-[:HAS_ACCOUNT]->(a)
+            """,
+            # Create OPENED_ON relationship with BusinessDate
+            """
+            UNWIND $rows AS row
+            MATCH (a:Account {account_id: row.account_id})
+            MATCH (d:BusinessDate {date: row.opening_date})
+            MERGE (a)-[:OPENED_ON]->(d)
+            """
+        ],
+        'Subsidiary': [
+            # Create Entity node and IS_SUBSIDIARY relationship
+            """
+            UNWIND $rows AS row
+            MERGE (s:Subsidiary {subsidiary_id: row.subsidiary_id})
+            MERGE (e:Entity {entity_id: row.subsidiary_id})
+            ON CREATE SET e += {
+                entity_type: 'subsidiary',
+                created_at: row.created_at,
+                updated_at: row.updated_at,
+                parent_entity_id: row.parent_institution_id
+            }
+            ON MATCH SET e += {
+                updated_at: row.updated_at,
+                parent_entity_id: row.parent_institution_id
+            }
+            MERGE (e)-[:IS_SUBSIDIARY {
+                created_at: row.created_at,
+                updated_at: row.updated_at
+            }]->(s)
+            """,
+            # Create OWNS_SUBSIDIARY relationship with Institution
+            """
+            UNWIND $rows AS row
+            MATCH (i:Institution {institution_id: row.parent_institution_id})
+            MATCH (s:Subsidiary {subsidiary_id: row.subsidiary_id})
+            MERGE (i)-[:OWNS_SUBSIDIARY {
+                ownership_percentage: row.parent_ownership_percentage,
+                acquisition_date: row.acquisition_date
+            }]->(s)
+            """,
+            # Create INCORPORATED_IN relationship with Country
+            """
+            UNWIND $rows AS row
+            MATCH (s:Subsidiary {subsidiary_id: row.subsidiary_id})
+            MATCH (c:Country {code: row.incorporation_country})
+            MERGE (s)-[:INCORPORATED_IN {
+                incorporation_date: row.incorporation_date
+            }]->(c)
+            """,
+            # Create INCORPORATED_ON relationship with BusinessDate
+            """
+            UNWIND $rows AS row
+            MATCH (s:Subsidiary {subsidiary_id: row.subsidiary_id})
+            MATCH (d:BusinessDate {date: row.incorporation_date})
+            MERGE (s)-[:INCORPORATED_ON]->(d)
+            """,
+            # If subsidiary is also a customer, create IS_CUSTOMER relationship
+            """
+            UNWIND $rows AS row
+            WITH row WHERE row.is_customer
+            MATCH (s:Subsidiary {subsidiary_id: row.subsidiary_id})
+            MATCH (i:Institution {institution_id: row.parent_institution_id})
+            MERGE (s)-[:IS_CUSTOMER {
+                customer_id: row.customer_id,
+                customer_onboarding_date: row.customer_onboarding_date,
+                customer_risk_rating: row.customer_risk_rating
+            }]->(i)
+            """
+        ],
+        'Institution': [
+            # Create Entity node and IS_INSTITUTION relationship
+            """
+            UNWIND $rows AS row
+            MERGE (i:Institution {institution_id: row.institution_id})
+            MERGE (e:Entity {entity_id: row.institution_id})
+            ON CREATE SET e += {
+                entity_type: 'institution',
+                created_at: row.created_at,
+                updated_at: row.updated_at
+            }
+            ON MATCH SET e.updated_at = row.updated_at
+            MERGE (e)-[:IS_INSTITUTION {
+                created_at: row.created_at,
+                updated_at: row.updated_at
+            }]->(i)
+            """,
+            # Create INCORPORATED_IN relationship with Country
+            """
+            UNWIND $rows AS row
+            MATCH (i:Institution {institution_id: row.institution_id})
+            MATCH (c:Country {code: row.incorporation_country})
+            MERGE (i)-[:INCORPORATED_IN {
+                incorporation_date: row.incorporation_date
+            }]->(c)
+            """,
+            # Create INCORPORATED_ON relationship with BusinessDate
+            """
+            UNWIND $rows AS row
+            MATCH (i:Institution {institution_id: row.institution_id})
+            MATCH (d:BusinessDate {date: row.incorporation_date})
+            MERGE (i)-[:INCORPORATED_ON]->(d)
+            """
+        ],
+        'Document': [
+            # Create ISSUED_ON relationship with BusinessDate
+            """
+            UNWIND $rows AS row
+            MATCH (d:Document {document_id: row.document_id})
+            MATCH (bd:BusinessDate {date: row.issue_date})
+            MERGE (d)-[:ISSUED_ON]->(bd)
+            """
+        ],
+        'BeneficialOwner': [
+            # Create CITIZEN_OF relationship
+            """
+            UNWIND $rows AS row
+            MATCH (bo:BeneficialOwner {owner_id: row.owner_id})
+            MATCH (c:Country {code: row.nationality})
+            MERGE (bo)-[:CITIZEN_OF]->(c)
+            """
+        ],
+        'Address': [
+            # Create LOCATED_IN relationship with Country
+            """
+            UNWIND $rows AS row
+            MATCH (a:Address {address_id: row.address_id})
+            MATCH (c:Country {code: row.country})
+            MERGE (a)-[:LOCATED_IN {
+                location_type: row.address_type,
+                start_date: row.effective_from
+            }]->(c)
+            """
+        ],
+        'AuthorizedPerson': [
+            # Create CITIZEN_OF relationship if nationality exists
+            """
+            UNWIND $rows AS row
+            WITH row WHERE row.nationality IS NOT NULL
+            MATCH (ap:AuthorizedPerson {person_id: row.person_id})
+            MATCH (c:Country {code: row.nationality})
+            MERGE (ap)-[:CITIZEN_OF]->(c)
+            """
+        ]
+    }
+
+    # Relationships from the owning Institution or Subsidiary, keyed by node
+    # type: (relationship type, property map). Rows are split by entity_type
+    # and written once per owner label, so every MATCH is a unique-constraint
+    # lookup rather than a scan over both labels.
+    OWNER_RELATIONSHIPS = {
+        'RiskAssessment': ('HAS_RISK_ASSESSMENT', ''),
+        'Document': ('HAS_DOCUMENT', ' {document_type: row.document_type}'),
+        'BeneficialOwner': (
+            'OWNED_BY',
+            ' {ownership_percentage: row.ownership_percentage, verification_date: row.verification_date}'
+        ),
+        'AuthorizedPerson': (
+            'HAS_AUTHORIZED_PERSON',
+            ' {title: row.title, authorization_date: row.authorization_start}'
+        ),
+        'ComplianceEvent': ('HAS_COMPLIANCE_EVENT', ''),
+        'Address': (
+            'HAS_ADDRESS',
+            ' {address_type: row.address_type, effective_from: row.effective_from}'
+        )
+    }
+
+    # Owner labels and their primary keys, keyed by the entity_type value
+    OWNER_LABELS = {
+        'institution': ('Institution', 'institution_id'),
+        'subsidiary': ('Subsidiary', 'subsidiary_id')
+    }
+
+    # Properties stored as YYYY-MM-DD strings
+    DATE_FIELDS = {
+        'incorporation_date', 'onboarding_date', 'acquisition_date', 'opening_date',
+        'assessment_date', 'next_review_date', 'authorization_start', 'authorization_end',
+        'last_verification_date', 'issue_date', 'expiry_date', 'verification_date',
+        'registration_date', 'event_date', 'effective_from', 'effective_to'
+    }
+
+    # Seconds a chunk group transaction may run before the server aborts it;
+    # transient failures are retried by execute_write
+    TRANSACTION_TIMEOUT = 60
+
+    # Attempts and first backoff delay (seconds, doubled per attempt) for
+    # auto-commit statements, which execute_write cannot retry
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.1
+
+    # Values stored in place of nulls; other null properties are omitted
+    NULL_DEFAULTS = {
+        'risk_score': 0.0,
+        'amount': 0.0,
+        'total_amount': 0.0,
+        'avg_risk_score': 0.0,
+        'processing_fee': 0.0,
+        'exchange_rate': 0.0,
+        'transaction_count': 0,
+        'alert_count': 0,
+        'screening_alert': False,
+        'material_subsidiary': False
+    }
+
+    # Fields copied into the generic ``id`` property, in order of precedence
+    ID_FIELDS = [
+        'entity_id', 'institution_id', 'subsidiary_id', 'assessment_id',
+        'person_id', 'event_id', 'transaction_id', 'account_id'
+    ]
+
+    # Seconds create_schema waits for new indexes to come online
+    INDEX_WAIT_TIMEOUT = 300
+
+    # Rows per server-side transaction when writing through APOC
+    APOC_BATCH_SIZE = 10000
+
+    # Tables whose nodes each table's relationship statements MATCH or MERGE
+    # against. Every table is written as soon as its dependencies are, so
+    # independent tables overlap. Dependencies are listed before dependents.
+    SAVE_DEPENDENCIES = {
+        'entities': [],
+        'institutions': ['entities'],
+        'subsidiaries': ['entities', 'institutions'],
+        'accounts': ['institutions'],
+        'transactions': ['accounts'],
+        'addresses': ['institutions', 'subsidiaries'],
+        'jurisdiction_presences': [],
+        'risk_assessments': ['institutions', 'subsidiaries'],
+        'compliance_events': ['institutions', 'subsidiaries'],
+        'authorized_persons': ['institutions', 'subsidiaries'],
+        'documents': ['institutions', 'subsidiaries'],
+        'beneficial_owners': ['institutions', 'subsidiaries']
+    }
+
     def __init__(self, uri: str, user: str, password: str):
         """Initialize Neo4j handler.
         
@@ -303,13 +655,30 @@ class Neo4jHandler(DatabaseHandler):
         self.password = password
         self.driver = None
         self.is_connected = False
+        # Number of sessions save_batch writes chunks through concurrently
+        self.max_concurrency = int(os.getenv('NEO4J_MAX_CONCURRENCY', 8))
+        # Let the server batch whole tables with apoc.periodic.iterate
+        self.use_apoc = os.getenv('NEO4J_USE_APOC', '').lower() in ('1', 'true', 'yes')
+        # Chunks each save_batch writer commits together in one transaction
+        self.commit_every = max(1, int(os.getenv('NEO4J_COMMIT_EVERY', 10)))
+        # Naming the database skips the home database lookup on each session
+        self.database = os.getenv('NEO4J_DATABASE', 'neo4j')
     
     async def connect(self) -> None:
         """Connect to Neo4j database."""
         try:
+            # Reuse the driver and its pool for the life of the handler
+            if self.is_connected and self.driver:
+                return
+            # Every concurrent chunk writer holds a pooled connection
             self.driver = AsyncGraphDatabase.driver(
                 self.uri,
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                max_connection_pool_size=int(os.getenv('NEO4J_POOL_MAX_SIZE', 32)),
+                connection_acquisition_timeout=int(os.getenv('NEO4J_ACQUISITION_TIMEOUT', 60)),
+                max_connection_lifetime=int(os.getenv('NEO4J_MAX_CONNECTION_LIFETIME', 3600)),
+                connection_timeout=30,
+                keep_alive=True
             )
             await self.driver.verify_connectivity()
             self.is_connected = True
@@ -332,7 +701,7 @@ class Neo4jHandler(DatabaseHandler):
     async def validate_schema(self) -> bool:
         """Validate database schema (constraints and indexes)."""
         try:
-            async with self.driver.session() as session:
+            async with self.driver.session(database=self.database) as session:
                 # Check indexes and constraints
                 result = await session.run("""
                     SHOW INDEXES
@@ -376,37 +745,156 @@ class Neo4jHandler(DatabaseHandler):
                               {'status': 'failed', 'error': str(e)})
             raise SchemaError(f"Schema validation failed: {str(e)}")
     
+    def _constraint_statements(self) -> List[str]:
+        """Build the unique constraint statements for every primary key."""
+        statements = []
+        for label, definition in self.NODE_SCHEMAS.items():
+            for prop in definition['primary_key']:
+                statements.append(f"""
+                    CREATE CONSTRAINT {label.lower()}_{prop}_unique
+                    IF NOT EXISTS
+                    FOR (n:{label})
+                    REQUIRE n.{prop} IS UNIQUE
+                """)
+        return statements
+
+    def _index_names(self) -> Dict[str, tuple]:
+        """Map each secondary index name to its (label, property).
+
+        Primary keys are already indexed by their unique constraint, which is
+        what the UNWIND MATCH/MERGE lookups (e.g. Account by account_id) rely
+        on, so they are skipped here.
+        """
+        return {
+            f"{label.lower()}_{prop}_idx": (label, prop)
+            for label, definition in self.NODE_SCHEMAS.items()
+            for prop in definition['required']
+            if prop not in definition['primary_key']
+        }
+
+    def _index_statements(self) -> List[str]:
+        """Build the secondary index statements for required fields."""
+        return [
+            f"""
+                    CREATE INDEX {name}
+                    IF NOT EXISTS
+                    FOR (n:{label})
+                    ON (n.{prop})
+                """
+            for name, (label, prop) in self._index_names().items()
+        ]
+
+    async def _run_schema(self, statements: List[str]) -> None:
+        """Run schema statements in one transaction and wait for indexes."""
+        async def run_all(tx):
+            for statement in statements:
+                result = await tx.run(statement)
+                await result.consume()
+
+        # Schema commands may share a transaction as long as it writes
+        # no data, so the whole schema commits in one round
+        async with self.driver.session(database=self.database) as session:
+            await session.execute_write(run_all)
+            # Indexes are populated in the background; wait until they
+            # are online so the first batches do not fall back to scans
+            result = await session.run("CALL db.awaitIndexes($timeout)", timeout=self.INDEX_WAIT_TIMEOUT)
+            await result.consume()
+
     async def create_schema(self) -> None:
         """Create database schema (constraints and indexes)."""
         try:
-            async with self.driver.session() as session:
-                # Create constraints and indexes for each node type
-                for label, definition in self.NODE_SCHEMAS.items():
-                    # Create unique constraints for primary keys
-                    for prop in definition['primary_key']:
-                        await session.run(f"""
-                            CREATE CONSTRAINT {label.lower()}_{prop}_unique
-                            IF NOT EXISTS
-                            FOR (n:{label})
-                            REQUIRE n.{prop} IS UNIQUE
-                        """)
-
-                    # Create indexes for required fields
-                    for prop in definition['required']:
-                        await session.run(f"""
-                            CREATE INDEX {label.lower()}_{prop}_idx
-                            IF NOT EXISTS
-                            FOR (n:{label})
-                            ON (n.{prop})
-                        """)
-
+            await self._run_schema(self._constraint_statements() + self._index_statements())
             self._log_operation('create_schema', {'status': 'success'})
 
         except Exception as e:
             self._log_operation('create_schema',
                               {'status': 'failed', 'error': str(e)})
             raise SchemaError(f"Failed to create schema: {str(e)}")
-    
+
+    @asynccontextmanager
+    async def bulk_load(self):
+        """Defer secondary index maintenance for the duration of a large load.
+
+        Indexes on non-key properties are dropped on entry so writes only
+        maintain the unique constraints the MERGE lookups need, then rebuilt
+        in one pass (and awaited) on exit.
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to database")
+
+        await self._run_schema([
+            f"DROP INDEX {name} IF EXISTS" for name in self._index_names()
+        ])
+        try:
+            yield self
+        finally:
+            try:
+                await self._run_schema(self._index_statements())
+                self._log_operation('bulk_load', {'status': 'success'})
+            except Exception as e:
+                self._log_operation('bulk_load', {'status': 'failed', 'error': str(e)})
+                raise SchemaError(f"Failed to restore indexes after bulk load: {str(e)}")
+
+    def _owner_queries(self, node_type: str) -> Dict[str, str]:
+        """Build the owner relationship query per entity_type for a node type."""
+        if node_type not in self.OWNER_RELATIONSHIPS:
+            return {}
+        relationship, properties = self.OWNER_RELATIONSHIPS[node_type]
+        primary_key = self.NODE_SCHEMAS[node_type]['primary_key'][0]
+        return {
+            entity_type: f"""
+                UNWIND $rows AS row
+                MATCH (o:{owner_label} {{{owner_key}: row.entity_id}})
+                MATCH (n:{node_type} {{{primary_key}: row.{primary_key}}})
+                MERGE (o)-[:{relationship}{properties}]->(n)
+            """
+            for entity_type, (owner_label, owner_key) in self.OWNER_LABELS.items()
+        }
+
+    @staticmethod
+    def _combined_query(queries: List[str], owner_queries: Dict[str, str]) -> str:
+        """Fold ``UNWIND $rows AS row`` statements into one statement.
+
+        Each statement body runs as a unit subquery per row, so a body that
+        filters a row out or finds nothing to MATCH does not stop the rest.
+        Owner bodies are guarded by the row's entity_type instead of being
+        sent with their own partition of the rows.
+        """
+        def body(query):
+            return re.sub(r'^\s*UNWIND \$rows AS row\s*', '', query, count=1).strip()
+
+        subqueries = [body(query) for query in queries] + [
+            f"WITH row WHERE toLower(toString(row.entity_type)) = '{entity_type}'\n{body(query)}"
+            for entity_type, query in owner_queries.items()
+        ]
+        return "UNWIND $rows AS row\n" + "\n".join(
+            f"CALL {{\n    WITH row\n    {subquery}\n}}" for subquery in subqueries
+        )
+
+    @staticmethod
+    def _shard_chunks(prepared: List[tuple], shard_key: str, batch_size: int) -> List[List[tuple]]:
+        """Pack (record, prepared_record) pairs into chunks of at most batch_size rows.
+
+        Rows are grouped by their shard key value and whole groups are packed
+        into chunks, so a key only spans chunks when its group alone exceeds
+        batch_size.
+        """
+        groups = {}
+        for item in prepared:
+            groups.setdefault(item[1].get(shard_key), []).append(item)
+
+        chunks, current = [], []
+        for group in groups.values():
+            for start in range(0, len(group), batch_size):
+                piece = group[start:start + batch_size]
+                if current and len(current) + len(piece) > batch_size:
+                    chunks.append(current)
+                    current = []
+                current.extend(piece)
+        if current:
+            chunks.append(current)
+        return chunks
+
     def _get_node_type(self, table_name: str) -> str:
         """Convert table name to node type."""
         # Map table names to node types
@@ -426,453 +914,157 @@ class Neo4jHandler(DatabaseHandler):
         }
         return table_to_node.get(table_name, table_name)
 
-    async def save_batch(self, table_name: str, records: List[Dict[str, Any]]) -> None:
-        """Save a batch of records to Neo4j."""
+    async def save_batch(self, table_name: str, records: List[Dict[str, Any]],
+                         batch_size: int = 1000, is_prepared: bool = False) -> None:
+        """Save a batch of records to Neo4j.
+
+        Records are prepared up front, unless ``is_prepared`` says they come
+        from _prepare_frame, and written in chunks of ``batch_size`` with one
+        UNWIND statement per chunk covering the node and its relationships.
+        """
+        if not records:
+            return
+
+        # Convert table name to node type
+        node_type = self._get_node_type(table_name)
         try:
-            # Convert table name to node type
-            node_type = self._get_node_type(table_name)
-            
-            # Validate records
-            for record in records:
+            # Check that required fields are present. Records from
+            # _prepare_frame all carry the frame's columns, so checking the
+            # first one covers the batch; their values were already
+            # validated column by column in _prepare_frame.
+            for record in (records[:1] if is_prepared else records):
                 self._validate_record(node_type, record)
-            
-            async with self.driver.session() as session:
-                failed_items = []
+
+            failed_items = []
+            if is_prepared:
+                prepared = [(record, record) for record in records]
+            else:
+                prepared = []
                 for record in records:
                     try:
-                        # Convert data types
-                        prepared_record = self._prepare_properties(record)
-                        
-                        # Get primary key field
-                        primary_key = self.NODE_SCHEMAS[node_type]['primary_key'][0]
-                        
-                        # Create node
-                        await session.run(f"""
-                            MERGE (n:{node_type} {{{primary_key}: $record.{primary_key}}})
-                            SET n = $record
-                        """, record=prepared_record)
-                        
-                        # Create relationships based on node type
-                        if node_type == 'Transaction':
-                            # Create relationships with accounts
-                            await session.run("""
-                                // Create accounts if they don't exist with required fields
-                                MERGE (debit:Account {account_id: $debit_account_id})
-                                ON CREATE SET 
-                                    debit.entity_id = $debit_account_id,
-                                    debit.entity_type = 'Institution',
-                                    debit.account_type = 'Unknown',
-                                    debit.account_number = $debit_account_id,
-                                    debit.currency = $currency,
-                                    debit.status = 'Active',
-                                    debit.opening_date = $transaction_date,
-                                    debit.balance = 0,
-                                    debit.risk_rating = 'Medium'
-
-                                WITH debit
-
-                                MERGE (credit:Account {account_id: $credit_account_id})
-                                ON CREATE SET 
-                                    credit.entity_id = $credit_account_id,
-                                    credit.entity_type = 'Institution',
-                                    credit.account_type = 'Unknown',
-                                    credit.account_number = $credit_account_id,
-                                    credit.currency = $currency,
-                                    credit.status = 'Active',
-                                    credit.opening_date = $transaction_date,
-                                    credit.balance = 0,
-                                    credit.risk_rating = 'Medium'
-
-                                WITH debit, credit
-
-                                // Match transaction
-                                MATCH (t:Transaction {transaction_id: $transaction_id})
-
-                                WITH debit, credit, t
-
-                                // Create SENT and RECEIVED relationships
-                                MERGE (debit)-[:SENT {
-                                    amount: $amount,
-                                    currency: $currency
-                                }]->(t)
-                                MERGE (t)-[:RECEIVED {
-                                    amount: $amount,
-                                    currency: $currency
-                                }]->(credit)
-
-                                WITH debit, credit, t
-
-                                // Create TRANSACTED relationships
-                                MERGE (debit)-[:TRANSACTED {
-                                    transaction_date: $transaction_date
-                                }]->(t)
-                                MERGE (credit)-[:TRANSACTED {
-                                    transaction_date: $transaction_date
-                                }]->(t)
-
-                                WITH t
-
-                                // Create TRANSACTED_ON relationship with BusinessDate
-                                MERGE (d:BusinessDate {date: $transaction_date})
-                                MERGE (t)-[:TRANSACTED_ON]->(d)
-                            """, {
-                                'transaction_id': prepared_record['transaction_id'],
-                                'debit_account_id': prepared_record['debit_account_id'],
-                                'credit_account_id': prepared_record['credit_account_id'],
-                                'amount': prepared_record['amount'],
-                                'currency': prepared_record['currency'],
-                                'transaction_date': prepared_record['transaction_date']
-                            })
-                        
-                        elif node_type == 'Account':
-                            # Create HAS_ACCOUNT relationship with Institution
-                            await session.run("""
-                                MATCH (i:Institution {institution_id: $entity_id})
-                                MATCH (a:Account {account_id: $account_id})
-                                MERGE (i)-[:HAS_ACCOUNT]->(a)
-                            """, {
-                                'entity_id': prepared_record['entity_id'],
-                                'account_id': prepared_record['account_id']
-                            })
-                            # Create OPENED_ON relationship with BusinessDate
-                            await session.run("""
-                                MATCH (a:Account {account_id: $account_id})
-                                MERGE (d:BusinessDate {date: $opening_date})
-                                MERGE (a)-[:OPENED_ON]->(d)
-                            """, {
-                                'account_id': prepared_record['account_id'],
-                                'opening_date': prepared_record['opening_date']
-                            })
-                        
-                        elif node_type == 'RiskAssessment':
-                            # Create HAS_RISK_ASSESSMENT relationship
-                            await session.run("""
-                                MATCH (i:Institution {institution_id: $entity_id})
-                                MATCH (r:RiskAssessment {assessment_id: $assessment_id})
-                                MERGE (i)-[:HAS_RISK_ASSESSMENT]->(r)
-                            """, {
-                                'entity_id': prepared_record['entity_id'],
-                                'assessment_id': prepared_record['assessment_id']
-                            })
-                            
-                        elif node_type == 'Subsidiary':
-                            # Add timestamps if not present
-                            if 'created_at' not in prepared_record:
-                                prepared_record['created_at'] = pd.Timestamp.now().isoformat()
-                            if 'updated_at' not in prepared_record:
-                                prepared_record['updated_at'] = pd.Timestamp.now().isoformat()
-
-                            try:
-                                # Create Entity node and IS_SUBSIDIARY relationship
-                                await session.run("""
-                                    MERGE (s:Subsidiary {subsidiary_id: $subsidiary_id})
-                                    MERGE (e:Entity {entity_id: $subsidiary_id})
-                                    ON CREATE SET e.entity_type = 'subsidiary',
-                                        e.created_at = $created_at,
-                                        e.updated_at = $updated_at,
-                                        e.parent_entity_id = $parent_institution_id
-                                    ON MATCH SET e.updated_at = $updated_at,
-                                        e.parent_entity_id = $parent_institution_id
-                                    MERGE (e)-[:IS_SUBSIDIARY {
-                                        created_at: $created_at,
-                                        updated_at: $updated_at
-                                    }]->(s)
-                                """, {
-                                    'subsidiary_id': prepared_record['subsidiary_id'],
-                                    'parent_institution_id': prepared_record['parent_institution_id'],
-                                    'created_at': prepared_record['created_at'],
-                                    'updated_at': prepared_record['updated_at']
-                                })
-                            except Exception as e:
-                                print(f"Failed to create Subsidiary Entity relationship: {str(e)}")
-                                print(f"Prepared record: {prepared_record}")
-                                raise e
-
-                            # Create OWNS_SUBSIDIARY relationship with Institution
-                            await session.run("""
-                                MATCH (i:Institution {institution_id: $parent_institution_id})
-                                MATCH (s:Subsidiary {subsidiary_id: $subsidiary_id})
-                                MERGE (i)-[:OWNS_SUBSIDIARY {
-                                    ownership_percentage: $ownership_percentage,
-                                    acquisition_date: $acquisition_date
-                                }]->(s)
-                            """, {
-                                'parent_institution_id': prepared_record['parent_institution_id'],
-                                'subsidiary_id': prepared_record['subsidiary_id'],
-                                'ownership_percentage': prepared_record['parent_ownership_percentage'],
-                                'acquisition_date': prepared_record['acquisition_date']
-                            })
-
-                            # Create INCORPORATED_IN relationship with Country
-                            await session.run("""
-                                MATCH (s:Subsidiary {subsidiary_id: $subsidiary_id})
-                                MERGE (c:Country {code: $country_code})
-                                MERGE (s)-[:INCORPORATED_IN {
-                                    incorporation_date: $incorporation_date
-                                }]->(c)
-                            """, {
-                                'subsidiary_id': prepared_record['subsidiary_id'],
-                                'country_code': prepared_record['incorporation_country'],
-                                'incorporation_date': prepared_record['incorporation_date']
-                            })
-
-                            # Create INCORPORATED_ON relationship with BusinessDate
-                            await session.run("""
-                                MATCH (s:Subsidiary {subsidiary_id: $subsidiary_id})
-                                MERGE (d:BusinessDate {date: $incorporation_date})
-                                MERGE (s)-[:INCORPORATED_ON]->(d)
-                            """, {
-                                'subsidiary_id': prepared_record['subsidiary_id'],
-                                'incorporation_date': prepared_record['incorporation_date']
-                            })
-
-                            # If subsidiary is also a customer, create IS_CUSTOMER relationship
-                            if prepared_record.get('is_customer', False):
-                                await session.run("""
-                                    MATCH (s:Subsidiary {subsidiary_id: $subsidiary_id})
-                                    MATCH (i:Institution {institution_id: $parent_institution_id})
-                                    MERGE (s)-[:IS_CUSTOMER {
-                                        customer_id: $customer_id,
-                                        customer_onboarding_date: $customer_onboarding_date,
-                                        customer_risk_rating: $customer_risk_rating
-                                    }]->(i)
-                                """, {
-                                    'subsidiary_id': prepared_record['subsidiary_id'],
-                                    'parent_institution_id': prepared_record['parent_institution_id'],
-                                    'customer_id': prepared_record.get('customer_id'),
-                                    'customer_onboarding_date': prepared_record.get('customer_onboarding_date'),
-                                    'customer_risk_rating': prepared_record.get('customer_risk_rating')
-                                })
-
-                        elif node_type == 'Institution':
-                            # Add timestamps if not present
-                            if 'created_at' not in prepared_record:
-                                prepared_record['created_at'] = pd.Timestamp.now().isoformat()
-                            if 'updated_at' not in prepared_record:
-                                prepared_record['updated_at'] = pd.Timestamp.now().isoformat()
-
-                            try:
-                                # Create Entity node and IS_INSTITUTION relationship
-                                await session.run("""
-                                    MERGE (i:Institution {institution_id: $institution_id})
-                                    MERGE (e:Entity {entity_id: $institution_id})
-                                    ON CREATE SET e.entity_type = 'institution',
-                                        e.created_at = $created_at,
-                                        e.updated_at = $updated_at
-                                    ON MATCH SET e.updated_at = $updated_at
-                                    MERGE (e)-[:IS_INSTITUTION {
-                                        created_at: $created_at,
-                                        updated_at: $updated_at
-                                    }]->(i)
-                                """, {
-                                    'institution_id': prepared_record['institution_id'],
-                                    'created_at': prepared_record['created_at'],
-                                    'updated_at': prepared_record['updated_at']
-                                })
-                            except Exception as e:
-                                print(f"Failed to create Institution Entity relationship: {str(e)}")
-                                print(f"Prepared record: {prepared_record}")
-                                raise e
-
-                            # Create INCORPORATED_IN relationship with Country
-                            await session.run("""
-                                MATCH (i:Institution {institution_id: $institution_id})
-                                MERGE (c:Country {code: $country_code})
-                                MERGE (i)-[:INCORPORATED_IN {
-                                    incorporation_date: $incorporation_date
-                                }]->(c)
-                            """, {
-                                'institution_id': prepared_record['institution_id'],
-                                'country_code': prepared_record['incorporation_country'],
-                                'incorporation_date': prepared_record['incorporation_date']
-                            })
-
-                            # Create INCORPORATED_ON relationship with BusinessDate
-                            await session.run("""
-                                MATCH (i:Institution {institution_id: $institution_id})
-                                MERGE (d:BusinessDate {date: $incorporation_date})
-                                MERGE (i)-[:INCORPORATED_ON]->(d)
-                            """, {
-                                'institution_id': prepared_record['institution_id'],
-                                'incorporation_date': prepared_record['incorporation_date']
-                            })
-
-                        elif node_type == 'Document':
-                            # Create HAS_DOCUMENT relationship
-                            await session.run("""
-                                MATCH (d:Document {document_id: $document_id})
-                                
-                                // Try to match Institution or Subsidiary based on entity_type
-                                OPTIONAL MATCH (i:Institution {institution_id: $entity_id})
-                                OPTIONAL MATCH (s:Subsidiary {subsidiary_id: $entity_id})
-                                
-                                WITH d, 
-                                     CASE WHEN i IS NOT NULL THEN i 
-                                          WHEN s IS NOT NULL THEN s 
-                                          ELSE null END as entity
-                                
-                                // Create relationship only if entity exists
-                                FOREACH (e IN CASE WHEN entity IS NOT NULL THEN [entity] ELSE [] END |
-                                    MERGE (e)-[:HAS_DOCUMENT {
-                                        document_type: $document_type
-                                    }]->(d)
-                                )
-                                
-                                WITH d
-                                
-                                // Create ISSUED_ON relationship with BusinessDate
-                                MERGE (bd:BusinessDate {date: $issue_date})
-                                MERGE (d)-[:ISSUED_ON]->(bd)
-                            """, {
-                                'document_id': prepared_record['document_id'],
-                                'entity_id': prepared_record['entity_id'],
-                                'entity_type': prepared_record['entity_type'].lower(),
-                                'document_type': prepared_record['document_type'],
-                                'issue_date': prepared_record['issue_date']
-                            })
-
-                        elif node_type == 'BeneficialOwner':
-                            # Create OWNED_BY and CITIZEN_OF relationships
-                            await session.run("""
-                                MATCH (bo:BeneficialOwner {owner_id: $owner_id})
-                                
-                                // Try to match Institution or Subsidiary based on entity_type
-                                OPTIONAL MATCH (i:Institution {institution_id: $entity_id})
-                                OPTIONAL MATCH (s:Subsidiary {subsidiary_id: $entity_id})
-                                
-                                WITH bo, 
-                                     CASE WHEN i IS NOT NULL THEN i 
-                                          WHEN s IS NOT NULL THEN s 
-                                          ELSE null END as entity
-                                
-                                // Create OWNED_BY relationship if entity exists
-                                FOREACH (e IN CASE WHEN entity IS NOT NULL THEN [entity] ELSE [] END |
-                                    MERGE (e)-[:OWNED_BY {
-                                        ownership_percentage: $ownership_percentage,
-                                        verification_date: $verification_date
-                                    }]->(bo)
-                                )
-                                
-                                WITH bo
-                                
-                                // Create CITIZEN_OF relationship
-                                MERGE (c:Country {code: $nationality})
-                                MERGE (bo)-[:CITIZEN_OF]->(c)
-                            """, {
-                                'owner_id': prepared_record['owner_id'],
-                                'entity_id': prepared_record['entity_id'],
-                                'entity_type': prepared_record['entity_type'].lower(),
-                                'ownership_percentage': prepared_record['ownership_percentage'],
-                                'verification_date': prepared_record['verification_date'],
-                                'nationality': prepared_record['nationality']
-                            })
-
-                        elif node_type == 'AuthorizedPerson':
-                            # Create HAS_AUTHORIZED_PERSON and CITIZEN_OF relationships
-                            await session.run("""
-                                MATCH (ap:AuthorizedPerson {person_id: $person_id})
-                                
-                                // Try to match Institution or Subsidiary based on entity_type
-                                OPTIONAL MATCH (i:Institution {institution_id: $entity_id})
-                                OPTIONAL MATCH (s:Subsidiary {subsidiary_id: $entity_id})
-                                
-                                WITH ap, 
-                                     CASE WHEN i IS NOT NULL THEN i 
-                                          WHEN s IS NOT NULL THEN s 
-                                          ELSE null END as entity
-                                
-                                // Create HAS_AUTHORIZED_PERSON relationship if entity exists
-                                FOREACH (e IN CASE WHEN entity IS NOT NULL THEN [entity] ELSE [] END |
-                                    MERGE (e)-[:HAS_AUTHORIZED_PERSON {
-                                        title: $title,
-                                        authorization_date: $authorization_start
-                                    }]->(ap)
-                                )
-                                
-                                WITH ap
-                                
-                                // Create CITIZEN_OF relationship if nationality exists
-                                FOREACH (nat IN CASE WHEN $nationality IS NOT NULL THEN [$nationality] ELSE [] END |
-                                    MERGE (c:Country {code: nat})
-                                    MERGE (ap)-[:CITIZEN_OF]->(c)
-                                )
-                            """, {
-                                'person_id': prepared_record['person_id'],
-                                'entity_id': prepared_record['entity_id'],
-                                'entity_type': prepared_record['entity_type'].lower(),
-                                'title': prepared_record['title'],
-                                'authorization_start': prepared_record['authorization_start'],
-                                'nationality': prepared_record.get('nationality')
-                            })
-
-                        elif node_type == 'ComplianceEvent':
-                            # Create HAS_COMPLIANCE_EVENT relationship
-                            await session.run("""
-                                MATCH (ce:ComplianceEvent {event_id: $event_id})
-                                
-                                // Try to match Institution or Subsidiary based on entity_type
-                                OPTIONAL MATCH (i:Institution {institution_id: $entity_id})
-                                OPTIONAL MATCH (s:Subsidiary {subsidiary_id: $entity_id})
-                                
-                                WITH ce, 
-                                     CASE WHEN i IS NOT NULL THEN i 
-                                          WHEN s IS NOT NULL THEN s 
-                                          ELSE null END as entity
-                                
-                                // Create HAS_COMPLIANCE_EVENT relationship if entity exists
-                                FOREACH (e IN CASE WHEN entity IS NOT NULL THEN [entity] ELSE [] END |
-                                    MERGE (e)-[:HAS_COMPLIANCE_EVENT]->(ce)
-                                )
-                            """, {
-                                'event_id': prepared_record['event_id'],
-                                'entity_id': prepared_record['entity_id'],
-                                'entity_type': prepared_record['entity_type'].lower()
-                            })
-
-                        elif node_type == 'RiskAssessment':
-                            # Create HAS_RISK_ASSESSMENT relationship
-                            await session.run("""
-                                MATCH (ra:RiskAssessment {assessment_id: $assessment_id})
-                                
-                                // Try to match Institution or Subsidiary based on entity_type
-                                OPTIONAL MATCH (i:Institution {institution_id: $entity_id})
-                                OPTIONAL MATCH (s:Subsidiary {subsidiary_id: $entity_id})
-                                
-                                WITH ra, 
-                                     CASE WHEN i IS NOT NULL THEN i 
-                                          WHEN s IS NOT NULL THEN s 
-                                          ELSE null END as entity
-                                
-                                // Create HAS_RISK_ASSESSMENT relationship if entity exists
-                                FOREACH (e IN CASE WHEN entity IS NOT NULL THEN [entity] ELSE [] END |
-                                    MERGE (e)-[:HAS_RISK_ASSESSMENT]->(ra)
-                                )
-                            """, {
-                                'assessment_id': prepared_record['assessment_id'],
-                                'entity_id': prepared_record['entity_id'],
-                                'entity_type': prepared_record['entity_type'].lower()
-                            })
-
+                        prepared.append((record, self._prepare_record(node_type, record)))
                     except Exception as e:
                         failed_items.append({
                             'record': record,
                             'error': str(e),
-                            'node_type': node_type,
-                            'prepared_record': prepared_record
+                            'node_type': node_type
                         })
-                        print(f"Failed to save {node_type} record: {str(e)}")
-                        print(f"Record: {record}")
-                        print(f"Prepared record: {prepared_record}")
+            if failed_items:
+                self.logger.warning("Failed to prepare %d/%d %s records, first error: %s",
+                                    len(failed_items), len(records), node_type, failed_items[0]['error'])
+
+            primary_key = self.NODE_SCHEMAS[node_type]['primary_key'][0]
+            queries = [f"""
+                UNWIND $rows AS row
+                MERGE (n:{node_type} {{{primary_key}: row.{primary_key}}})
+                SET n = row
+            """] + self.RELATIONSHIP_QUERIES.get(node_type, [])
+
+            owner_queries = self._owner_queries(node_type)
+            # The driver path sends one statement per chunk rather than one
+            # round trip per pattern
+            combined_query = self._combined_query(queries, owner_queries)
+
+            def statements(rows):
+                # Each UNWIND statement paired with the rows it applies to
+                for query in queries:
+                    yield query, rows
+                if not owner_queries:
+                    return
+                # Partition the rows by owner type in a single pass
+                owned_rows = {}
+                for row in rows:
+                    owned_rows.setdefault(str(row.get('entity_type', '')).lower(), []).append(row)
+                for entity_type, query in owner_queries.items():
+                    if entity_type in owned_rows:
+                        yield query, owned_rows[entity_type]
+
+            def record_failure(chunk, error):
+                failed_items.extend({
+                    'record': record,
+                    'error': str(error),
+                    'node_type': node_type,
+                    'prepared_record': prepared_record
+                } for record, prepared_record in chunk)
+                self.logger.warning("Failed to save %d %s records: %s", len(chunk), node_type, error)
+
+            @unit_of_work(timeout=self.TRANSACTION_TIMEOUT)
+            async def write_chunks(tx, group):
+                for query, values in inline_dimensions:
+                    result = await tx.run(query, values=values)
+                    await result.consume()
+                for chunk in group:
+                    result = await tx.run(combined_query, rows=[prepared_record for _, prepared_record in chunk])
+                    await result.consume()
+
+            # Shard on the node each row's relationships attach to (or the
+            # primary key) so rows sharing that node are written together and
+            # concurrent writers rarely contend for its locks. Transactions
+            # still MERGE their counterparty accounts, which other chunks
+            # may hold.
+            chunks = self._shard_chunks(prepared, self.SHARD_KEYS.get(node_type, primary_key), batch_size)
+            pending = iter(chunks)
+
+            async def save_chunks():
+                # Each worker holds one session and pulls groups of chunks
+                # from the shared iterator until it is exhausted, committing
+                # each group in one transaction
+                async with self.driver.session(database=self.database) as session:
+                    while True:
+                        group = list(islice(pending, self.commit_every))
+                        if not group:
+                            break
+                        try:
+                            await session.execute_write(write_chunks, group)
+                        except Exception as e:
+                            if len(group) == 1:
+                                record_failure(group[0], e)
+                                continue
+                            # Retry the group chunk by chunk so only the
+                            # failing chunks are reported
+                            for chunk in group:
+                                try:
+                                    await session.execute_write(write_chunks, [chunk])
+                                except Exception as chunk_error:
+                                    record_failure(chunk, chunk_error)
+
+            # Dimension nodes are MERGEd once up front, so the chunk writers
+            # only MATCH them and never contend on creating them. A table
+            # small enough for a single transaction MERGEs them in that same
+            # transaction instead, saving a commit for small batches.
+            inline_dimensions = []
+            if prepared:
+                dimensions = self._dimension_statements(node_type, [prepared_record for _, prepared_record in prepared])
+                if len(chunks) <= self.commit_every and not self.use_apoc:
+                    inline_dimensions = dimensions
+                else:
+                    await self._merge_dimensions(dimensions)
+
+            if self.use_apoc and prepared:
+                # Hand the whole table to the server and let APOC batch it.
+                # Only the node upsert touches distinct keys, so it alone is
+                # safe to run with parallel writers.
+                try:
+                    async with self.driver.session(database=self.database) as session:
+                        rows = [prepared_record for _, prepared_record in prepared]
+                        for i, (query, query_rows) in enumerate(statements(rows)):
+                            await self._iterate_rows(session, query, query_rows, parallel=i == 0)
+                except Exception as e:
+                    record_failure(prepared, e)
+            else:
+                await asyncio.gather(*(
+                    save_chunks() for _ in range(min(self.max_concurrency, -(-len(chunks) // self.commit_every)))
+                ))
+
+            if failed_items:
+                raise BatchError(f"Failed to save {len(failed_items)} records", failed_items=failed_items)
 
-                if failed_items:
-                    raise BatchError(f"Failed to save {len(failed_items)} records", failed_items=failed_items)
-            
             self._log_operation('save_batch', {
                 'status': 'success',
                 'node_type': node_type,
                 'record_count': len(records)
             })
-            
+
         except BatchError:
             raise
         except Exception as e:
@@ -888,20 +1080,234 @@ class Neo4jHandler(DatabaseHandler):
             if isinstance(e, (ValidationError, SchemaError)):
                 raise
             raise BatchError(f"Failed to save batch: {str(e)}", failed_items=failed_items)
-    
+
+    def _dimension_statements(self, node_type: str, rows: List[Dict[str, Any]]) -> List[tuple]:
+        """Build (query, values) MERGEs for the distinct BusinessDate and Country nodes the rows refer to."""
+        statements = []
+        for label, fields in self.DIMENSION_FIELDS.get(node_type, {}).items():
+            # Sorted so concurrent tables take the node locks in one order
+            values = sorted({row[field] for row in rows for field in fields if row.get(field) is not None})
+            if values:
+                key = self.NODE_SCHEMAS[label]['primary_key'][0]
+                statements.append((f"UNWIND $values AS value MERGE (:{label} {{{key}: value}})", values))
+        return statements
+
+    async def _merge_dimensions(self, statements: List[tuple]) -> None:
+        """Run dimension MERGEs from _dimension_statements in their own transaction."""
+        if not statements:
+            return
+
+        @unit_of_work(timeout=self.TRANSACTION_TIMEOUT)
+        async def merge_all(tx):
+            for query, values in statements:
+                result = await tx.run(query, values=values)
+                await result.consume()
+
+        async with self.driver.session(database=self.database) as session:
+            await session.execute_write(merge_all)
+
+    async def _run_with_retry(self, run):
+        """Await ``run()``, retrying transient failures with exponential backoff.
+
+        Only for idempotent statements: a retried attempt may repeat writes
+        that an earlier attempt already committed.
+        """
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                return await run()
+            except (ServiceUnavailable, SessionExpired, TransientError) as e:
+                if attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+                self.logger.warning("Retrying after transient Neo4j error (attempt %d/%d): %s",
+                                    attempt + 1, self.RETRY_ATTEMPTS, e)
+                await asyncio.sleep(self.RETRY_BASE_DELAY * 2 ** attempt)
+
+    async def _iterate_rows(self, session, query: str, rows: List[Dict[str, Any]],
+                            parallel: bool = False) -> None:
+        """Run an ``UNWIND $rows AS row`` statement through apoc.periodic.iterate."""
+        # APOC binds each batch item to ``row``, so only the body is passed on
+        action = re.sub(r'^\s*UNWIND \$rows AS row\s*', '', query, count=1)
+
+        async def run():
+            # Every statement MERGEs, so a repeated batch is harmless. APOC
+            # retries a batch that hits a deadlock between parallel writers
+            # itself, before it is counted as failed.
+            result = await session.run("""
+                CALL apoc.periodic.iterate(
+                    'UNWIND $rows AS row RETURN row',
+                    $action,
+                    {batchSize: $batch_size, parallel: $parallel, concurrency: $concurrency,
+                     retries: $retries, params: {rows: $rows}}
+                )
+                YIELD failedBatches, errorMessages
+                RETURN failedBatches, errorMessages
+            """, action=action, rows=rows, batch_size=self.APOC_BATCH_SIZE, parallel=parallel,
+                concurrency=self.max_concurrency, retries=self.RETRY_ATTEMPTS)
+            return await result.single()
+
+        record = await self._run_with_retry(run)
+        if record['failedBatches']:
+            raise DatabaseError(f"apoc.periodic.iterate failed: {record['errorMessages']}")
+
     async def save_to_neo4j(self, data: Dict[str, pd.DataFrame]) -> None:
-        """Save data to Neo4j database."""
-        await self.save_batch(data)
-    
+        """Save a dictionary of DataFrames to Neo4j in dependency order."""
+        tasks = {}
+
+        async def save_table(table_name):
+            await asyncio.gather(*(tasks[dep] for dep in self.SAVE_DEPENDENCIES[table_name] if dep in tasks))
+            await self.save_frame(table_name, data[table_name])
+
+        for table_name in self.SAVE_DEPENDENCIES:
+            if table_name in data and not data[table_name].empty:
+                tasks[table_name] = asyncio.ensure_future(save_table(table_name))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            # Stop the remaining writers on the first failure
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+    async def save_frame(self, table_name: str, df: pd.DataFrame, batch_size: int = 1000) -> None:
+        """Save a DataFrame to Neo4j, preparing it column by column.
+
+        The frame is streamed in slices that keep every concurrent writer
+        busy. The next slice is prepared in a worker thread while the current
+        one is written, so at most two slices of prepared records are held.
+        """
+        if df.empty:
+            return
+        node_type = self._get_node_type(table_name)
+        slice_rows = batch_size * self.commit_every * self.max_concurrency
+        starts = range(0, len(df), slice_rows)
+        if len(starts) == 1:
+            await self.save_batch(table_name, self._prepare_frame(node_type, df),
+                                  batch_size=batch_size, is_prepared=True)
+            return
+
+        loop = asyncio.get_running_loop()
+
+        def prepare(start):
+            return self._prepare_frame(node_type, df.iloc[start:start + slice_rows])
+
+        pending = loop.run_in_executor(None, prepare, starts[0])
+        try:
+            for i in range(len(starts)):
+                records = await pending
+                if i + 1 < len(starts):
+                    pending = loop.run_in_executor(None, prepare, starts[i + 1])
+                await self.save_batch(table_name, records, batch_size=batch_size, is_prepared=True)
+        finally:
+            pending.cancel()
+
+    def _prepare_frame(self, node_type: str, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Vectorized equivalent of _prepare_record for a whole DataFrame."""
+        df = df.copy()
+
+        # Same checks as _prepare_properties, once per column: dates must be
+        # '%Y-%m-%d' strings, timestamps ISO strings or dates
+        for col, date_format in (('incorporation_date', '%Y-%m-%d'), ('opening_date', '%Y-%m-%d'),
+                                 ('transaction_date', 'ISO8601'), ('assessment_date', 'ISO8601'),
+                                 ('created_at', 'ISO8601'), ('updated_at', 'ISO8601')):
+            if col not in df.columns:
+                continue
+            values = df[col].dropna()
+            if pd.api.types.is_numeric_dtype(df[col]) and not values.empty:
+                raise ValidationError(f"Field {col} must be a date string, got {df[col].dtype}")
+            if not values.empty and isinstance(values.iloc[0], str):
+                # utc=True lets naive and offset timestamps parse together
+                parsed = pd.to_datetime(values, format=date_format, errors='coerce', utc=True)
+                invalid = values[parsed.isna()]
+                if not invalid.empty:
+                    raise ValidationError(f"Invalid value for field {col}: {invalid.unique()[:5].tolist()}")
+
+        for col, default in self.NULL_DEFAULTS.items():
+            if col in df.columns:
+                df[col] = df[col].astype(object).where(df[col].notna(), default)
+
+        for col in df.columns:
+            values = df[col].dropna()
+            if df[col].dtype == object and not values.empty:
+                if isinstance(values.iloc[0], Enum):
+                    # Look up the few distinct members once instead of
+                    # calling into Python for every row
+                    members = {v: v.value for v in pd.unique(values) if isinstance(v, Enum)}
+                    df[col] = df[col].map(members).where(df[col].isin(list(members)), df[col])
+                elif isinstance(values.iloc[0], UUID):
+                    df[col] = df[col].astype(str).where(df[col].notna(), None)
+
+        # Map ID fields based on node type and ensure they are strings
+        id_field = next((col for col in self.ID_FIELDS if col in df.columns), None)
+        if id_field is not None:
+            df['id'] = df[id_field].astype(str)
+        for col in ('account_id', 'entity_id', 'currency', 'transaction_id'):
+            if col in df.columns:
+                df[col] = df[col].astype(str).where(df[col].notna(), None)
+
+        if node_type in ('Institution', 'Subsidiary'):
+            now = pd.Timestamp.now().isoformat()
+            for col in ('created_at', 'updated_at'):
+                if col not in df.columns:
+                    df[col] = now
+
+        return self._records_from_frame(df)
+
+    @classmethod
+    def _records_from_frame(cls, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Convert a DataFrame to save_batch records, formatting dates and encoding JSON columns once."""
+        # Build each column as a plain list once (tolist() yields native
+        # Python scalars) and zip the rows together, rather than copying the
+        # frame, casting it to object and materializing it again in to_dict
+        columns = {}
+        for col in df.columns:
+            series = df[col]
+            # The models already carry dates as '%Y-%m-%d' strings, which
+            # pass through; only datetime columns and date objects are
+            # formatted. Other timestamps stay datetime objects so the driver
+            # stores them as temporal values, as _prepare_properties does.
+            if col in cls.DATE_FIELDS:
+                if pd.api.types.is_datetime64_any_dtype(series):
+                    series = _format_dates(series)
+                elif isinstance(next(iter(series.dropna()), None), date):
+                    series = _format_dates(pd.to_datetime(series))
+            elif pd.api.types.is_datetime64_dtype(series):
+                # NumPy converts the whole array to datetime objects in C
+                series = pd.Series(series.to_numpy().astype('datetime64[us]').astype(object),
+                                   index=series.index, dtype=object)
+            elif pd.api.types.is_datetime64_any_dtype(series):
+                # Timezone-aware columns keep their offset per element
+                series = pd.Series([None if pd.isna(ts) else ts.to_pydatetime() for ts in series],
+                                   index=series.index, dtype=object)
+            nulls = series.isna()
+            if nulls.any():
+                values = series.astype(object).where(~nulls, None).tolist()
+            else:
+                values = series.tolist()
+            first = next((v for v in values if v is not None), None)
+            if isinstance(first, (dict, list)):
+                values = [_dumps_json(v) if isinstance(v, (dict, list)) else v for v in values]
+            columns[col] = values
+        keys = list(columns)
+        return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
     async def wipe_clean(self) -> None:
         """Wipe all data from the database while preserving indexes and constraints."""
         try:
-            async with self.driver.session() as session:
-                # Delete all relationships first
-                await session.run("MATCH ()-[r]-() DELETE r")
-                # Then delete all nodes
-                await session.run("MATCH (n) DELETE n")
-                
+            async with self.driver.session(database=self.database) as session:
+                # Detach and delete nodes in batches so large graphs do not
+                # build one huge transaction. CALL IN TRANSACTIONS needs an
+                # auto-commit transaction, hence session.run.
+                async def run():
+                    result = await session.run("""
+                        MATCH (n)
+                        CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+                    """)
+                    await result.consume()
+
+                # Batches already committed stay deleted, so a retry resumes
+                await self._run_with_retry(run)
+
             self._log_operation('wipe_clean', {'status': 'success'})
         except Exception as e:
             self._log_operation('wipe_clean', {'status': 'failed', 'error': str(e)})
@@ -913,7 +1319,7 @@ class Neo4jHandler(DatabaseHandler):
             if not self.is_connected or not self.driver:
                 return False
                 
-            async with self.driver.session() as session:
+            async with self.driver.session(database=self.database) as session:
                 result = await session.run("RETURN 1")
                 value = await result.single()
                 return value[0] == 1
@@ -995,6 +1401,17 @@ class Neo4jHandler(DatabaseHandler):
         if missing_fields:
             raise ValidationError(f"Missing required fields for {node_type}: {missing_fields}")
 
+    def _prepare_record(self, node_type: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare a record for the UNWIND payload of its node type."""
+        prepared_record = self._prepare_properties(record)
+        if node_type in ('Institution', 'Subsidiary'):
+            # Add timestamps if not present
+            if 'created_at' not in prepared_record:
+                prepared_record['created_at'] = pd.Timestamp.now().isoformat()
+            if 'updated_at' not in prepared_record:
+                prepared_record['updated_at'] = pd.Timestamp.now().isoformat()
+        return prepared_record
+
     def _prepare_properties(self, record: dict) -> dict:
         """Prepare properties for Neo4j by converting data types."""
         prepared = {}
@@ -1003,12 +1420,8 @@ class Neo4jHandler(DatabaseHandler):
         for key, value in record.items():
             if value is None:
                 # Handle null values based on field type
-                if key in ['risk_score', 'amount', 'total_amount', 'avg_risk_score', 'processing_fee', 'exchange_rate']:
-                    value = 0.0
-                elif key in ['transaction_count', 'alert_count']:
-                    value = 0
-                elif key in ['screening_alert', 'material_subsidiary']:
-                    value = False
+                if key in self.NULL_DEFAULTS:
+                    value = self.NULL_DEFAULTS[key]
                 else:
                     continue  # Skip null values for other fields
                 
@@ -1045,7 +1458,7 @@ class Neo4jHandler(DatabaseHandler):
                     else:
                         prepared[key] = float(value) if isinstance(value, float) or '.' in str(value) else int(value)
                 elif isinstance(value, (dict, list)):
-                    prepared[key] = json.dumps(value)
+                    prepared[key] = _dumps_json(value)
                 else:
                     prepared[key] = str(value)
             except (ValueError, TypeError) as e:
@@ -1089,12 +1502,8 @@ class Neo4jHandler(DatabaseHandler):
         """
         if not data:
             return
-            
-        # Convert list of dicts to DataFrame
-        df = pd.DataFrame(data)
-        
-        # Save the data using save_batch
-        await self.save_batch(table_name, data)
+
+        await self.save_batch(table_name, data, batch_size=batch_size)
 
     async def create_node(self, label: str, properties: Dict[str, Any]) -> None:
         """Create a node with the given label and properties."""
@@ -1111,10 +1520,12 @@ class Neo4jHandler(DatabaseHandler):
             # Convert enum values to strings
             prepared_properties = self._prepare_properties(properties)
             
-            # Create node
-            async with self.driver.session() as session:
+            # Upsert on the primary key, as save_batch does, so repeating a
+            # load updates the node instead of failing its unique constraint
+            primary_key = self.NODE_SCHEMAS[label]['primary_key'][0]
+            async with self.driver.session(database=self.database) as session:
                 query = (
-                    f"CREATE (n:{label}) "
+                    f"MERGE (n:{label} {{{primary_key}: $properties.{primary_key}}}) "
                     f"SET n = $properties "
                     f"RETURN n"
                 )
@@ -1,23 +1,55 @@
 """PostgreSQL database handler."""
 
 import os
-from typing import Dict, List, Any, Optional
+import hashlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 import asyncpg
 import json
+import orjson
 from datetime import datetime
-import numpy as np
 import logging
 from asyncpg import create_pool
 from uuid import UUID
 
 from .base import DatabaseHandler, DatabaseError
-from .exceptions import ConnectionError, ValidationError, SchemaError, BatchError, DatabaseInitializationError
+from .exceptions import ConnectionError, ValidationError, SchemaError, DatabaseInitializationError
 from ..models import (
     Institution, Address, Account, BeneficialOwner, Transaction,
     BusinessType, OperationalStatus, RiskRating
 )
 
+
+@lru_cache(maxsize=None)
+def _insert_sql(table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build the parameterized INSERT statement for a table and column set.
+
+    The statement only depends on the table and its column order, so it is
+    built once per combination and reused for every subsequent batch.
+    """
+    placeholders = ','.join(f'${i+1}' for i in range(len(columns)))
+    return f"INSERT INTO {table_name} ({','.join(columns)}) VALUES ({placeholders})"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a value for a jsonb column using the binary wire format.
+
+    Strings are assumed to already hold serialized JSON and are passed
+    through; everything else is serialized with orjson. The leading byte is
+    the jsonb binary format version.
+    """
+    if isinstance(value, str):
+        return b'\x01' + value.encode()
+    return b'\x01' + orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode a binary jsonb value, skipping the format version byte."""
+    return orjson.loads(data[1:])
+
+
 class PostgresHandler(DatabaseHandler):
     """Handler for PostgreSQL database operations."""
     
@@ -287,6 +319,22 @@ class PostgresHandler(DatabaseHandler):
         }
     }
     
+    # Tables in foreign key order: every table follows the tables it references
+    TABLE_ORDER = (
+        'entities',
+        'institutions',
+        'subsidiaries',
+        'addresses',
+        'beneficial_owners',
+        'accounts',
+        'transactions',
+        'risk_assessments',
+        'compliance_events',
+        'authorized_persons',
+        'documents',
+        'jurisdiction_presences'
+    )
+
     # Foreign key constraints to be added after table creation
     FOREIGN_KEY_CONSTRAINTS = {
         'entities': [
@@ -329,6 +377,27 @@ class PostgresHandler(DatabaseHandler):
         ]
     }
     
+    # Enum types created alongside the tables
+    ENUM_TYPES = {
+        'business_type': ['hedge_fund', 'bank', 'broker_dealer', 'insurance',
+                          'asset_manager', 'pension_fund', 'other'],
+        'operational_status': ['active', 'dormant', 'liquidating'],
+        'risk_rating': ['low', 'medium', 'high'],
+        'transaction_type': ['ach', 'wire', 'check', 'lockbox'],
+        'transaction_status': ['completed', 'pending', 'failed', 'reversed']
+    }
+
+    # Session settings applied to every pooled connection. JIT compilation only
+    # adds planning latency to the short INSERT statements issued here.
+    SERVER_SETTINGS = {
+        'jit': 'off',
+        'application_name': 'aml_ingest'
+    }
+
+    # Frames with at least this many rows are loaded with COPY; smaller ones
+    # go through executemany, where COPY's setup cost is not worth paying
+    COPY_THRESHOLD = 500
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize PostgreSQL handler."""
         super().__init__()
@@ -355,11 +424,36 @@ class PostgresHandler(DatabaseHandler):
                 db = os.getenv('POSTGRES_DB', self.config.get('database', 'aml_monitoring'))
                 user = os.getenv('POSTGRES_USER', self.config.get('user', 'postgres'))
                 password = os.getenv('POSTGRES_PASSWORD', self.config.get('password', ''))
-                
+
+                # Size the pool per CPU rather than with a fixed global value
+                max_size = int(os.getenv(
+                    'POSTGRES_POOL_MAX_SIZE',
+                    str(self.config.get('pool_max_size', 2 * (os.cpu_count() or 1)))
+                ))
+                min_size = min(int(self.config.get('pool_min_size', 1)), max_size)
+
+                server_settings = dict(self.SERVER_SETTINGS)
+                if self.config.get('bulk_load', False):
+                    # Trades durability of the last few commits for commit latency
+                    server_settings['synchronous_commit'] = 'off'
+
+                pool_kwargs = {}
+                if self.config.get('pgbouncer', False):
+                    # PgBouncer in transaction/statement mode cannot keep named
+                    # prepared statements alive across pooled server connections
+                    pool_kwargs['statement_cache_size'] = 0
+
                 self.pool = await asyncpg.create_pool(
                     f'postgresql://{user}:{password}@{host}:{port}/{db}',
-                    min_size=1,
-                    max_size=5
+                    min_size=min_size,
+                    max_size=max_size,
+                    command_timeout=self.config.get('command_timeout', 60),
+                    max_inactive_connection_lifetime=self.config.get(
+                        'max_inactive_connection_lifetime', 300
+                    ),
+                    server_settings=server_settings,
+                    init=self._init_connection,
+                    **pool_kwargs
                 )
                 
                 # Test connection
@@ -376,6 +470,17 @@ class PostgresHandler(DatabaseHandler):
             self._log_operation('connect', {'status': 'failed', 'error': str(e)})
             raise ConnectionError(f"Failed to connect to PostgreSQL: {str(e)}")
     
+    @staticmethod
+    async def _init_connection(conn) -> None:
+        """Register per-connection type codecs."""
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema='pg_catalog',
+            format='binary'
+        )
+
     async def close(self) -> None:
         """Close database connection."""
         if self.pool:
@@ -426,53 +531,30 @@ class PostgresHandler(DatabaseHandler):
         """Create database schema."""
         try:
             async with self.pool.acquire() as conn:
-                # Drop existing tables in reverse order to handle dependencies
-                for table_name in reversed(list(self.TABLE_SCHEMAS.keys())):
-                    await conn.execute(f"""
-                        DROP TABLE IF EXISTS {table_name} CASCADE
-                    """)
-
-                # Create tables in order (base tables first, then dependent tables)
-                table_order = [
-                    'entities',  # Base table
-                    'institutions',
-                    'subsidiaries',
-                    'addresses',
-                    'risk_assessments',
-                    'authorized_persons',
-                    'documents',
-                    'jurisdiction_presences',
-                    'accounts',
-                    'beneficial_owners',
-                    'transactions',
-                    'compliance_events'
+                # Drop all existing tables in one statement; CASCADE takes
+                # care of the dependencies between them
+                statements = [
+                    f"DROP TABLE IF EXISTS {', '.join(reversed(list(self.TABLE_SCHEMAS.keys())))} CASCADE"
                 ]
 
-                # Create tables
-                for table_name in table_order:
+                # Create tables in order (base tables first, then dependent tables)
+                for table_name in self.TABLE_ORDER:
                     if table_name in self.TABLE_SCHEMAS:
                         columns = []
                         for col, dtype in self.TABLE_SCHEMAS[table_name].items():
                             columns.append(f"{col} {dtype}")
 
-                        create_stmt = f"""
+                        statements.append(f"""
                             CREATE TABLE {table_name} (
                                 {', '.join(columns)}
                             )
-                        """
-                        await conn.execute(create_stmt)
+                        """)
+
+                # Send the whole DDL script in one round trip
+                await conn.execute(';\n'.join(statements))
 
                 # Add foreign key constraints
-                for table_name, constraints in self.FOREIGN_KEY_CONSTRAINTS.items():
-                    for i, (column, ref_table, ref_column) in enumerate(constraints):
-                        constraint_name = f"fk_{table_name}_{column}_{ref_table}"
-                        await conn.execute(f"""
-                            ALTER TABLE {table_name}
-                            ADD CONSTRAINT {constraint_name}
-                            FOREIGN KEY ({column})
-                            REFERENCES {ref_table}({ref_column})
-                            ON DELETE CASCADE
-                        """)
+                await self._add_foreign_keys(conn)
 
             self._log_operation('create_schema', {'status': 'success'})
 
@@ -481,13 +563,124 @@ class PostgresHandler(DatabaseHandler):
                               {'status': 'failed', 'error': str(e)})
             raise SchemaError(f"Failed to create schema: {str(e)}")
     
-    async def initialize_database(self) -> None:
-        """Initialize the database with required tables and enums."""
+    @staticmethod
+    def _foreign_key_name(table_name: str, column: str, ref_table: str) -> str:
+        """Return the constraint name used for a foreign key."""
+        return f"fk_{table_name}_{column}_{ref_table}"
+
+    async def _add_foreign_keys(self, conn) -> None:
+        """Add all foreign key constraints in a single round trip."""
+        statements = []
+        for table_name, constraints in self.FOREIGN_KEY_CONSTRAINTS.items():
+            for column, ref_table, ref_column in constraints:
+                constraint_name = self._foreign_key_name(table_name, column, ref_table)
+                statements.append(
+                    f"ALTER TABLE {table_name} "
+                    f"ADD CONSTRAINT {constraint_name} "
+                    f"FOREIGN KEY ({column}) "
+                    f"REFERENCES {ref_table}({ref_column}) "
+                    f"ON DELETE CASCADE"
+                )
+        await conn.execute(';\n'.join(statements))
+
+    async def _drop_foreign_keys(self, conn) -> None:
+        """Drop all foreign key constraints in a single round trip."""
+        statements = []
+        for table_name, constraints in self.FOREIGN_KEY_CONSTRAINTS.items():
+            for column, ref_table, _ in constraints:
+                constraint_name = self._foreign_key_name(table_name, column, ref_table)
+                statements.append(
+                    f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {constraint_name}"
+                )
+        await conn.execute(';\n'.join(statements))
+
+    @asynccontextmanager
+    async def bulk_load(self):
+        """Defer constraint maintenance for the duration of a large initial load.
+
+        Foreign keys are dropped on entry so inserts skip the per-row
+        referential checks, then re-added (validating every row in one pass)
+        and the loaded tables analyzed on exit. Combine with the ``bulk_load``
+        config flag to also run the pooled sessions with
+        ``synchronous_commit=off``.
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to database")
+
+        async with self.pool.acquire() as conn:
+            await self._drop_foreign_keys(conn)
+        try:
+            yield self
+        finally:
+            try:
+                async with self.pool.acquire() as conn:
+                    await self._add_foreign_keys(conn)
+                    await conn.execute(
+                        'ANALYZE ' + ', '.join(self.TABLE_SCHEMAS.keys())
+                    )
+                self._log_operation('bulk_load', {'status': 'success'})
+            except Exception as e:
+                self._log_operation('bulk_load', {'status': 'failed', 'error': str(e)})
+                raise SchemaError(f"Failed to restore constraints after bulk load: {str(e)}")
+
+    @classmethod
+    def schema_hash(cls) -> str:
+        """Return a SHA-256 digest of the canonical schema definition."""
+        canonical = json.dumps({
+            'tables': cls.TABLE_SCHEMAS,
+            'foreign_keys': cls.FOREIGN_KEY_CONSTRAINTS,
+            'enums': cls.ENUM_TYPES
+        }, sort_keys=True)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def _schema_is_current(self, conn, schema_hash: str) -> bool:
+        """Check whether the deployed schema matches the given hash."""
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS _schema_meta (
+                id boolean PRIMARY KEY DEFAULT true CHECK (id),
+                hash text NOT NULL
+            )
+        """)
+        current = await conn.fetchval('SELECT hash FROM _schema_meta')
+        if current != schema_hash:
+            return False
+
+        # Guard against tables dropped by hand since the hash was recorded
+        missing = await conn.fetchval(
+            'SELECT count(*) FROM unnest($1::text[]) AS t(name) WHERE to_regclass(name) IS NULL',
+            list(self.TABLE_SCHEMAS.keys())
+        )
+        if missing:
+            return False
+
+        # ... and against foreign keys left dropped by an interrupted bulk load
+        foreign_keys = [
+            self._foreign_key_name(table_name, column, ref_table)
+            for table_name, constraints in self.FOREIGN_KEY_CONSTRAINTS.items()
+            for column, ref_table, _ in constraints
+        ]
+        present = await conn.fetchval(
+            "SELECT count(*) FROM pg_constraint WHERE contype = 'f' AND conname = ANY($1::text[])",
+            foreign_keys
+        )
+        return present == len(foreign_keys)
+
+    async def initialize_database(self, force: bool = False) -> None:
+        """Initialize the database with required tables and enums.
+
+        The drop/create cycle is skipped when the schema recorded in
+        ``_schema_meta`` matches the current definition, unless ``force`` is set.
+        """
         if not self.is_connected:
             raise ConnectionError("Not connected to database")
 
         try:
             async with self.pool.acquire() as conn:
+                schema_hash = self.schema_hash()
+                if not force and await self._schema_is_current(conn, schema_hash):
+                    self._log_operation('initialize_database', {'status': 'skipped'})
+                    return
+
                 # Drop existing enums and tables
                 await conn.execute("""
                     DROP TABLE IF EXISTS transactions CASCADE;
@@ -508,32 +701,19 @@ class PostgresHandler(DatabaseHandler):
                 """)
 
                 # Create enum types
-                await conn.execute("""
-                    CREATE TYPE business_type AS ENUM (
-                        'hedge_fund', 'bank', 'broker_dealer', 'insurance',
-                        'asset_manager', 'pension_fund', 'other'
-                    );
-
-                    CREATE TYPE operational_status AS ENUM (
-                        'active', 'dormant', 'liquidating'
-                    );
-
-                    CREATE TYPE risk_rating AS ENUM (
-                        'low', 'medium', 'high'
-                    );
-
-                    CREATE TYPE transaction_type AS ENUM (
-                        'ach', 'wire', 'check', 'lockbox'
-                    );
-
-                    CREATE TYPE transaction_status AS ENUM (
-                        'completed', 'pending', 'failed', 'reversed'
-                    );
-                """)
+                await conn.execute(';\n'.join(
+                    f"CREATE TYPE {name} AS ENUM ({', '.join(repr(v) for v in values)})"
+                    for name, values in self.ENUM_TYPES.items()
+                ))
 
                 # Create tables
                 await self.create_schema()
 
+                await conn.execute("""
+                    INSERT INTO _schema_meta (id, hash) VALUES (true, $1)
+                    ON CONFLICT (id) DO UPDATE SET hash = EXCLUDED.hash
+                """, schema_hash)
+
             self._log_operation('initialize_database', {'status': 'success'})
 
         except Exception as e:
@@ -717,123 +897,6 @@ class PostgresHandler(DatabaseHandler):
                 raise ValidationError(f"Data validation failed: {str(e)}")
             raise
     
-    async def save_batch(self, data: Dict[str, pd.DataFrame], batch_size: int = 1000) -> None:
-        """Save a batch of data to PostgreSQL."""
-        if not self.is_connected:
-            raise ConnectionError("Not connected to database")
-    
-        # Validate data first - let validation errors propagate up
-        await self.validate_data(data)
-
-        try:
-            async with self.pool.acquire() as conn:
-                # Process each table in the correct order (respecting foreign keys)
-                table_order = [
-                    'entities',
-                    'institutions',
-                    'subsidiaries',
-                    'addresses',
-                    'risk_assessments',
-                    'authorized_persons',
-                    'documents',
-                    'jurisdiction_presences',
-                    'accounts',
-                    'beneficial_owners',
-                    'transactions',
-                    'compliance_events'
-                ]
-
-                for table in table_order:
-                    if table in data and not data[table].empty:
-                        df = data[table].copy()  # Make a copy to avoid modifying original
-    
-                        # Convert dates to proper format
-                        date_columns = [col for col, dtype in self.TABLE_SCHEMAS[table].items()
-                                     if 'DATE' in dtype.upper()]
-                        for col in date_columns:
-                            if col in df.columns:
-                                df[col] = pd.to_datetime(df[col]).dt.date
-    
-                        # Convert JSON columns
-                        json_columns = [col for col, dtype in self.TABLE_SCHEMAS[table].items()
-                                     if 'JSONB' in dtype]
-                        for col in json_columns:
-                            if col in df.columns:
-                                def convert_to_json(x):
-                                    if pd.isna(x) or x is None:
-                                        return None
-                                    if isinstance(x, (list, dict)):
-                                        return json.dumps(x)
-                                    if isinstance(x, str):
-                                        try:
-                                            json.loads(x)  # Validate it's already valid JSON
-                                            return x
-                                        except:
-                                            return json.dumps(x)
-                                    return json.dumps(str(x))
-
-                                df[col] = df[col].apply(convert_to_json)
-    
-                        # Convert enum columns
-                        enum_columns = {
-                            'business_type': {'hedge_fund', 'bank', 'broker_dealer', 'insurance',
-                                    'asset_manager', 'pension_fund', 'other'},
-                            'operational_status': {'active', 'dormant', 'liquidating'},
-                            'risk_rating': {'low', 'medium', 'high'},
-                            'transaction_type': {'ach', 'wire', 'check', 'lockbox'},
-                            'transaction_status': {'completed', 'pending', 'failed', 'reversed'}
-                        }
-
-                        for col in enum_columns:
-                            if col in df.columns:
-                                df[col] = df[col].apply(lambda x: x.value if hasattr(x, 'value') else str(x).lower())
-
-                        # Handle NULL values for optional columns
-                        optional_columns = [col for col, dtype in self.TABLE_SCHEMAS[table].items()
-                                         if 'NOT NULL' not in dtype]
-                        for col in optional_columns:
-                            if col in df.columns:
-                                df[col] = df[col].replace({pd.NA: None, np.nan: None, '': None})
-
-                        # Convert numeric columns
-                        numeric_columns = [col for col, dtype in self.TABLE_SCHEMAS[table].items()
-                                        if any(num_type in dtype.upper() for num_type in ['INTEGER', 'DECIMAL', 'NUMERIC'])]
-                        for col in numeric_columns:
-                            if col in df.columns:
-                                df[col] = pd.to_numeric(df[col], errors='coerce').replace({pd.NA: None, np.nan: None})
-
-                        # Convert any remaining dictionary fields to JSON strings
-                        for col in df.columns:
-                            if col in df.columns and df[col].apply(lambda x: isinstance(x, dict)).any():
-                                df[col] = df[col].apply(lambda x: json.dumps(x) if isinstance(x, dict) else x)
-    
-                        # Generate SQL for batch insert with UPSERT
-                        columns = list(df.columns)
-                        placeholders = [f'${i+1}' for i in range(len(columns))]
-                        primary_key = next(col for col, dtype in self.TABLE_SCHEMAS[table].items()
-                                        if 'PRIMARY KEY' in dtype)
-    
-                        insert_sql = f"""
-                            INSERT INTO {table} ({', '.join(columns)})
-                            VALUES ({', '.join(placeholders)})
-                            ON CONFLICT ({primary_key}) DO UPDATE
-                            SET {', '.join(f"{col} = EXCLUDED.{col}"
-                                         for col in columns if col != primary_key)}
-                        """
-
-                        # Insert in batches
-                        for i in range(0, len(df), batch_size):
-                            batch_df = df.iloc[i:i + batch_size]
-                            values = [tuple(row) for _, row in batch_df.iterrows()]
-                            await conn.executemany(insert_sql, values)
-
-            self._log_operation('save_batch', {'status': 'success'})
-
-        except Exception as e:
-            self._log_operation('save_batch',
-                              {'status': 'failed', 'error': str(e)})
-            raise BatchError(f"Failed to save batch: {str(e)}", [])
-    
     async def wipe_clean(self) -> None:
         """Wipe all data from the database while preserving the schema."""
         try:
@@ -842,15 +905,10 @@ class PostgresHandler(DatabaseHandler):
                 await self.connect()
 
             async with self.pool.acquire() as conn:
-                # Disable foreign key checks temporarily
-                await conn.execute('SET CONSTRAINTS ALL DEFERRED')
-                
-                # Delete data from all tables in reverse order
-                for table_name in reversed(list(self.TABLE_SCHEMAS.keys())):
-                    await conn.execute(f'TRUNCATE TABLE {table_name} CASCADE')
-                
-                # Re-enable foreign key checks
-                await conn.execute('SET CONSTRAINTS ALL IMMEDIATE')
+                # Truncating every table in one statement needs no deferred
+                # foreign key checks and costs a single round trip
+                tables = ', '.join(reversed(list(self.TABLE_SCHEMAS.keys())))
+                await conn.execute(f'TRUNCATE TABLE {tables} CASCADE')
             
             self._log_operation('wipe_clean', {'status': 'success'})
             
@@ -890,70 +948,44 @@ class PostgresHandler(DatabaseHandler):
                     prepared_data[key] = value
         return prepared_data
 
+    def _coerce_frame(self, table_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast a DataFrame's columns to the Python values asyncpg encodes."""
+        df = df.copy()
+        schema = self.TABLE_SCHEMAS[table_name]
+
+        for col in df.columns:
+            type_ = schema.get(col, '')
+            if type_.startswith('boolean'):
+                df[col] = df[col].astype(bool)
+            elif type_.startswith(('date', 'timestamp')):
+                # Timestamps subclass datetime and are encoded by asyncpg as is
+                df[col] = pd.to_datetime(df[col]).astype(object)
+
+        # Cast to Python scalars and turn NaN/NaT into NULL. UUID columns keep
+        # the models' uuid.UUID objects, which the binary protocol sends as
+        # their 16 raw bytes without a text round trip.
+        return df.astype(object).where(df.notna(), None)
+
     async def insert_data(self, table_name: str, df: pd.DataFrame) -> None:
         """Insert data into a table."""
         try:
             async with self.pool.acquire() as conn:
-                # Convert DataFrame to list of tuples
                 columns = df.columns.tolist()
-                values = [tuple(x) for x in df.to_records(index=False)]
-                
-                # Convert UUID strings to UUID objects and handle boolean values
-                uuid_columns = ['institution_id', 'account_id', 'owner_id', 'transaction_id', 
-                              'subsidiary_id', 'assessment_id', 'person_id', 'document_id', 
-                              'presence_id', 'event_id', 'address_id', 'entity_id']
-                
-                # Get boolean columns from schema
-                bool_columns = [col for col, type_ in self.TABLE_SCHEMAS[table_name].items() 
-                              if type_.startswith('boolean')]
-                
-                # Get date columns from schema
-                date_columns = [col for col, type_ in self.TABLE_SCHEMAS[table_name].items() 
-                              if type_.startswith('date') or type_.startswith('timestamp')]
-                
-                # Get JSON columns from schema
-                json_columns = [col for col, type_ in self.TABLE_SCHEMAS[table_name].items() 
-                              if type_.startswith('json')]
-                
-                # Get numeric columns from schema
-                numeric_columns = [col for col, type_ in self.TABLE_SCHEMAS[table_name].items() 
-                                 if type_.startswith(('integer', 'numeric', 'decimal'))]
-                
-                for i, value in enumerate(values):
-                    value_list = list(value)
-                    for j, col in enumerate(columns):
-                        # Handle UUIDs
-                        if col in uuid_columns and isinstance(value_list[j], str):
-                            value_list[j] = UUID(value_list[j])
-                        # Handle booleans
-                        elif col in bool_columns:
-                            value_list[j] = bool(value_list[j])
-                        # Handle dates
-                        elif col in date_columns:
-                            if isinstance(value_list[j], str):
-                                value_list[j] = pd.to_datetime(value_list[j]).to_pydatetime()
-                            elif isinstance(value_list[j], pd.Timestamp) or isinstance(value_list[j], np.datetime64):
-                                value_list[j] = pd.to_datetime(value_list[j]).to_pydatetime()
-                        # Handle JSON fields (convert dicts to JSON strings)
-                        elif col in json_columns and isinstance(value_list[j], dict):
-                            value_list[j] = json.dumps(value_list[j])
-                        # Handle NaN in numeric columns
-                        elif col in numeric_columns and pd.isna(value_list[j]):
-                            value_list[j] = None
-                    values[i] = tuple(value_list)
-
-                # Create placeholders for the VALUES clause
-                placeholders = ','.join(f'${i+1}' for i in range(len(columns)))
-                
-                # Construct and execute the INSERT query
-                query = f"""
-                    INSERT INTO {table_name} ({','.join(columns)})
-                    VALUES ({placeholders})
-                """
-                
-                # Execute the query for each row
-                for value in values:
-                    await conn.execute(query, *value)
+                coerced = self._coerce_frame(table_name, df)
+
+                if self.config.get('bulk_load', False) or len(df) >= self.COPY_THRESHOLD:
+                    # Stream tuples through the binary COPY protocol without
+                    # materializing them as a list first
+                    await conn.copy_records_to_table(
+                        table_name,
+                        records=coerced.itertuples(index=False, name=None),
+                        columns=columns,
+                        schema_name='public'
+                    )
+                else:
+                    # Small frames are pipelined in a single executemany
+                    await conn.executemany(_insert_sql(table_name, tuple(columns)),
+                                           list(coerced.itertuples(index=False, name=None)))
                 
                 self._log_operation('insert_data', {'table': table_name})
         except Exception as e:
@@ -964,22 +996,7 @@ class PostgresHandler(DatabaseHandler):
         """Save a batch of data to the database."""
         try:
             # Save data in the correct order to respect foreign key constraints
-            save_order = [
-                'entities',
-                'institutions',
-                'subsidiaries',
-                'addresses',
-                'beneficial_owners',
-                'accounts',
-                'transactions',
-                'risk_assessments',
-                'compliance_events',
-                'authorized_persons',
-                'documents',
-                'jurisdiction_presences'
-            ]
-            
-            for table in save_order:
+            for table in self.TABLE_ORDER:
                 if table in df_data and not df_data[table].empty:
                     await self.insert_data(table, df_data[table])
         except Exception as e:
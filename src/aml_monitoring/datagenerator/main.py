@@ -48,6 +48,8 @@ def parse_args():
                           help='Number of institutions to process in each batch')
     group_batch.add_argument('--transactions-per-batch', type=int, default=10000,
                           help='Maximum number of transactions to save in each batch')
+    group_batch.add_argument('--bulk-load', action='store_true',
+                          help='Defer PostgreSQL foreign keys and Neo4j secondary indexes, and disable synchronous commit during the load')
     
     # Utility parameters
     group_util = parser.add_argument_group('Utility Parameters')
@@ -66,6 +68,10 @@ async def async_main():
     # Load environment variables
     load_dotenv(args.env_file)
 
+    # Per-record progress is logged at debug level
+    if args.verbose:
+        logging.getLogger('aml_monitoring').setLevel(logging.DEBUG)
+
     generator = None
     try:
         # Configure database handlers
@@ -74,7 +80,8 @@ async def async_main():
             'port': int(os.getenv('POSTGRES_PORT', '5432')),
             'database': os.getenv('POSTGRES_DB', 'aml_monitoring'),
             'user': os.getenv('POSTGRES_USER', 'aml_user'),
-            'password': os.getenv('POSTGRES_PASSWORD', 'aml_password')
+            'password': os.getenv('POSTGRES_PASSWORD', 'aml_password'),
+            'bulk_load': args.bulk_load
         }
         
         neo4j_uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
@@ -116,7 +123,11 @@ async def async_main():
         await generator.initialize_db()
         await postgres_handler.wipe_clean()
         await neo4j_handler.wipe_clean()
-        await generator.generate_all()
+        if args.bulk_load:
+            async with postgres_handler.bulk_load(), neo4j_handler.bulk_load():
+                await generator.generate_all()
+        else:
+            await generator.generate_all()
         
         logger.info("Done")
     except Exception as e:
@@ -34,19 +34,19 @@ class DataDictionary:
     def _load_dictionary(self, csv_path: str):
         """Load and parse the data dictionary CSV."""
         df = pd.read_csv(csv_path)
+        columns = ['Table', 'Column', 'Data Type', 'Required', 'Description', 'Constraints', 'Examples']
         
-        for _, row in df.iterrows():
-            table = row['Table']
+        for table, name, type_, required, description, constraints, examples in df[columns].itertuples(index=False, name=None):
             if table not in self.tables:
                 self.tables[table] = {'columns': []}
             
             self.tables[table]['columns'].append({
-                'name': row['Column'],
-                'type': row['Data Type'],
-                'required': row['Required'],
-                'description': row['Description'],
-                'constraints': row['Constraints'],
-                'examples': row['Examples']
+                'name': name,
+                'type': type_,
+                'required': required,
+                'description': description,
+                'constraints': constraints,
+                'examples': examples
             })
 
     def _infer_relationships(self):
@@ -0,0 +1,206 @@
+"""Unit tests for Neo4j handler helpers that need no database."""
+
+import uuid
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from aml_monitoring.datagenerator.database.exceptions import ValidationError
+from aml_monitoring.datagenerator.database.neo4j import Neo4jHandler
+from aml_monitoring.datagenerator.models import TransactionType
+
+
+class TestOwnerQueries:
+    """Tests for the per-label owner relationship queries."""
+
+    def test_one_label_specific_query_per_owner_type(self):
+        """Test that each owner label gets its own indexed MATCH."""
+        handler = Neo4jHandler('bolt://localhost:7687', 'neo4j', 'password')
+        queries = handler._owner_queries('Document')
+        assert set(queries) == {'institution', 'subsidiary'}
+        assert 'MATCH (o:Institution {institution_id: row.entity_id})' in queries['institution']
+        assert 'MATCH (o:Subsidiary {subsidiary_id: row.entity_id})' in queries['subsidiary']
+        assert ' OR ' not in queries['institution']
+
+    def test_unowned_node_type_has_no_queries(self):
+        """Test that node types without an owner produce no queries."""
+        handler = Neo4jHandler('bolt://localhost:7687', 'neo4j', 'password')
+        assert handler._owner_queries('Transaction') == {}
+
+    def test_combined_query_runs_each_pattern_as_a_subquery(self):
+        """Test that a chunk's patterns fold into one UNWIND statement."""
+        handler = Neo4jHandler('bolt://localhost:7687', 'neo4j', 'password')
+        owner_queries = handler._owner_queries('Document')
+        query = handler._combined_query(['UNWIND $rows AS row\nMERGE (n:Document {document_id: row.document_id})'],
+                                        owner_queries)
+        assert query.count('UNWIND') == 1
+        assert query.count('CALL {') == 1 + len(owner_queries)
+        assert "toLower(toString(row.entity_type)) = 'subsidiary'" in query
+
+
+class TestIndexNames:
+    """Tests for the secondary indexes deferred during a bulk load."""
+
+    def test_primary_keys_left_to_constraints(self):
+        """Test that only non-key properties get a droppable index."""
+        indexes = Neo4jHandler('bolt://localhost', 'neo4j', 'password')._index_names()
+        assert indexes['account_entity_id_idx'] == ('Account', 'entity_id')
+        assert ('Account', 'account_id') not in indexes.values()
+        assert not any(label in ('BusinessDate', 'Country') for label, _ in indexes.values())
+
+
+class TestDimensionStatements:
+    """Tests for the shared BusinessDate/Country MERGEs run before row writes."""
+
+    def test_distinct_sorted_keys_per_label(self):
+        """Test that each label gets its distinct non-null keys in sorted order."""
+        handler = Neo4jHandler('bolt://localhost', 'neo4j', 'password')
+        rows = [
+            {'incorporation_date': '2024-02-01', 'incorporation_country': 'US'},
+            {'incorporation_date': '2024-01-01', 'incorporation_country': None},
+            {'incorporation_date': '2024-02-01', 'incorporation_country': 'GB'}
+        ]
+        statements = dict(handler._dimension_statements('Institution', rows))
+        assert list(statements.values()) == [['2024-01-01', '2024-02-01'], ['GB', 'US']]
+        assert 'MERGE (:Country {code: value})' in list(statements)[1]
+        assert handler._dimension_statements('Entity', rows) == []
+
+
+class TestShardChunks:
+    """Tests for packing rows into shard-aligned chunks."""
+
+    def test_groups_stay_together_within_batch_size(self):
+        """Test that chunks are bounded and a key's rows share one chunk."""
+        prepared = [(None, {'account_id': key}) for key in 'aabbbcd']
+        chunks = Neo4jHandler._shard_chunks(prepared, 'account_id', 3)
+        assert [[row['account_id'] for _, row in chunk] for chunk in chunks] == [['a', 'a'], ['b', 'b', 'b'], ['c', 'd']]
+
+    def test_oversized_group_is_split(self):
+        """Test that a single hot key cannot exceed batch_size per chunk."""
+        prepared = [(None, {'account_id': 'a'})] * 5
+        chunks = Neo4jHandler._shard_chunks(prepared, 'account_id', 2)
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+class TestSaveFrame:
+    """Tests for streaming a DataFrame into save_batch in slices."""
+
+    @pytest.mark.asyncio
+    async def test_slices_saved_in_order(self, monkeypatch):
+        """Test that every row is prepared and saved once, slice by slice."""
+        handler = Neo4jHandler('bolt://localhost', 'neo4j', 'password')
+        handler.max_concurrency = 1
+        handler.commit_every = 1
+        saved = []
+
+        async def save_batch(table_name, records, batch_size, is_prepared):
+            saved.append([record['account_id'] for record in records])
+
+        monkeypatch.setattr(handler, 'save_batch', save_batch)
+        df = pd.DataFrame({'account_id': [f'a{i}' for i in range(25)], 'balance': range(25)})
+        await handler.save_frame('accounts', df, batch_size=10)
+        assert [len(ids) for ids in saved] == [10, 10, 5]
+        assert sum(saved, []) == list(df['account_id'])
+
+
+class TestRunWithRetry:
+    """Tests for the backoff wrapper around auto-commit statements."""
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_retried_then_raised(self, monkeypatch):
+        """Test that transient errors are retried up to the attempt limit."""
+        monkeypatch.setattr(Neo4jHandler, 'RETRY_BASE_DELAY', 0)
+        handler = Neo4jHandler('bolt://localhost', 'neo4j', 'password')
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise ServiceUnavailable('connection reset')
+            return 'ok'
+
+        async def broken():
+            calls.append(1)
+            raise ServiceUnavailable('connection reset')
+
+        assert await handler._run_with_retry(flaky) == 'ok'
+        calls.clear()
+        with pytest.raises(ServiceUnavailable):
+            await handler._run_with_retry(broken)
+        assert len(calls) == Neo4jHandler.RETRY_ATTEMPTS
+
+
+class TestRecordsFromFrame:
+    """Tests for the DataFrame to save_batch record conversion."""
+
+    def test_json_columns_encoded_and_nulls_mapped(self):
+        """Test that dict columns are serialized once and NaN becomes None."""
+        df = pd.DataFrame({
+            'assessment_id': ['r1', 'r2'],
+            'risk_factors': [{'geographic': 3}, None],
+            'risk_score': [4.5, np.nan]
+        })
+        records = Neo4jHandler._records_from_frame(df)
+        assert records == [
+            {'assessment_id': 'r1', 'risk_factors': '{"geographic":3}', 'risk_score': 4.5},
+            {'assessment_id': 'r2', 'risk_factors': None, 'risk_score': None}
+        ]
+
+    def test_date_columns_formatted_per_column(self):
+        """Test that date fields and timestamps are formatted without per-row parsing."""
+        df = pd.DataFrame({
+            'document_id': ['d1', 'd2'],
+            'issue_date': pd.to_datetime(['2024-03-01', '2024-03-02']),
+            'expiry_date': [date(2025, 3, 1), None],
+            'verification_date': ['2024-03-05', None],
+            'created_at': pd.to_datetime(['2024-03-01 08:15:00', '2024-03-02 09:30:00'])
+        })
+        records = Neo4jHandler._records_from_frame(df)
+        assert records[0]['issue_date'] == '2024-03-01'
+        assert records[0]['expiry_date'] == '2025-03-01'
+        assert records[1]['expiry_date'] is None
+        assert records[0]['verification_date'] == '2024-03-05'
+        assert records[1]['created_at'] == datetime(2024, 3, 2, 9, 30)
+        assert type(records[1]['created_at']) is datetime
+
+
+class TestPrepareFrame:
+    """Tests for the vectorized record preparation."""
+
+    def test_matches_per_record_preparation(self):
+        """Test that column-wise preparation yields the per-record properties."""
+        handler = Neo4jHandler('bolt://localhost:7687', 'neo4j', 'password')
+        record = {
+            'transaction_id': 't1',
+            'account_id': 'a1',
+            'transaction_type': TransactionType.WIRE,
+            'transaction_date': '2024-01-01',
+            'amount': 12.5,
+            'currency': 'USD',
+            'risk_score': None,
+            'screening_alert': False,
+            'batch_id': uuid.uuid4(),
+            'created_at': datetime(2024, 1, 1, 9, 30, 15, 123456),
+            'updated_at': datetime(2024, 1, 2, 17, 0)
+        }
+        expected = handler._prepare_record('Transaction', record)
+        row = handler._prepare_frame('Transaction', pd.DataFrame([record]))[0]
+        assert {k: v for k, v in row.items() if v is not None} == expected
+        assert type(row['created_at']) is datetime
+
+    def test_numeric_dates_rejected(self):
+        """Test that a numeric incorporation date fails validation."""
+        handler = Neo4jHandler('bolt://localhost:7687', 'neo4j', 'password')
+        with pytest.raises(ValidationError):
+            handler._prepare_frame('Institution', pd.DataFrame({'incorporation_date': [20240101]}))
+
+    def test_malformed_date_strings_rejected(self):
+        """Test that date strings are checked against their format per column."""
+        handler = Neo4jHandler('bolt://localhost:7687', 'neo4j', 'password')
+        with pytest.raises(ValidationError, match='01/02/2024'):
+            handler._prepare_frame('Institution', pd.DataFrame({'incorporation_date': ['2024-01-01', '01/02/2024']}))
+        with pytest.raises(ValidationError, match='yesterday'):
+            handler._prepare_frame('Transaction', pd.DataFrame({'transaction_date': ['2024-01-01T10:00:00', 'yesterday']}))
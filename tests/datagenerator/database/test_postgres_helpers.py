@@ -0,0 +1,76 @@
+"""Unit tests for PostgreSQL handler helpers that need no database."""
+
+import numpy as np
+
+from aml_monitoring.datagenerator.database.postgres import (
+    PostgresHandler, _insert_sql, _encode_jsonb, _decode_jsonb
+)
+
+
+class TestInsertSql:
+    """Tests for the memoized INSERT statement builder."""
+
+    def test_placeholders_follow_column_order(self):
+        """Test that placeholders are numbered in column order."""
+        sql = _insert_sql('accounts', ('account_id', 'balance'))
+        assert sql == "INSERT INTO accounts (account_id,balance) VALUES ($1,$2)"
+
+    def test_statement_is_reused(self):
+        """Test that the same column set returns the cached statement."""
+        first = _insert_sql('transactions', ('transaction_id', 'amount'))
+        second = _insert_sql('transactions', ('transaction_id', 'amount'))
+        assert first is second
+
+
+class TestJsonbCodec:
+    """Tests for the binary jsonb codec."""
+
+    def test_round_trip_dict(self):
+        """Test encoding and decoding a dictionary."""
+        value = {'geographic': 3, 'product': np.int64(2)}
+        encoded = _encode_jsonb(value)
+        assert encoded[:1] == b'\x01'
+        assert _decode_jsonb(encoded) == {'geographic': 3, 'product': 2}
+
+    def test_serialized_string_passes_through(self):
+        """Test that pre-serialized JSON is not encoded twice."""
+        encoded = _encode_jsonb('{"email": "a@b.com"}')
+        assert _decode_jsonb(encoded) == {'email': 'a@b.com'}
+
+
+class TestSchemaHash:
+    """Tests for the schema fingerprint used to skip redundant DDL."""
+
+    def test_hash_is_stable(self):
+        """Test that the hash does not change between calls."""
+        assert PostgresHandler.schema_hash() == PostgresHandler.schema_hash()
+
+    def test_hash_tracks_schema_changes(self, monkeypatch):
+        """Test that altering a table definition changes the hash."""
+        original = PostgresHandler.schema_hash()
+        schemas = {**PostgresHandler.TABLE_SCHEMAS,
+                   'accounts': {**PostgresHandler.TABLE_SCHEMAS['accounts'],
+                                'nickname': 'text'}}
+        monkeypatch.setattr(PostgresHandler, 'TABLE_SCHEMAS', schemas)
+        assert PostgresHandler.schema_hash() != original
+
+
+class TestCoerceFrame:
+    """Tests for the column-wise DataFrame conversion used by insert_data."""
+
+    def test_casts_and_nulls(self):
+        """Test that dates, booleans and missing values are converted per column."""
+        import pandas as pd
+        from datetime import datetime
+
+        handler = PostgresHandler({})
+        df = pd.DataFrame({
+            'subsidiary_id': ['a', 'b'],
+            'acquisition_date': ['2024-01-02', None],
+            'is_customer': [1, 0],
+            'customer_status': [None, 'active']
+        })
+        records = list(handler._coerce_frame('subsidiaries', df).itertuples(index=False, name=None))
+        assert records[0] == ('a', datetime(2024, 1, 2), True, None)
+        assert records[1] == ('b', None, False, 'active')
+        assert type(records[0][2]) is bool